@@ -0,0 +1,43 @@
+"""Console entry point for ``gctl`` and ``python -m ground_control``."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import typer
+
+
+def main() -> None:
+    """Run the CLI, answering version queries before importing Typer or Rich."""
+    if sys.argv[1:] in (["version"], ["-V"], ["--version"]):
+        from ground_control import __version__
+
+        print(f"Ground Control v{__version__}")
+        return
+
+    from ground_control.cli import app
+
+    _prune_subcommands(app, sys.argv[1] if len(sys.argv) > 1 else None)
+    app()
+
+
+def _prune_subcommands(app: typer.Typer, command: str | None) -> None:
+    """Drop the sub-apps that ``command`` cannot reach, so Typer never builds them.
+
+    A top-level command needs none of them and a sub-app name needs only
+    itself. Anything else (no arguments, --help, completion) keeps them all.
+    """
+    top_level = {
+        info.name or info.callback.__name__.replace("_", "-")
+        for info in app.registered_commands
+    }
+    if command in top_level:
+        app.registered_groups = []
+    elif any(group.name == command for group in app.registered_groups):
+        app.registered_groups = [g for g in app.registered_groups if g.name == command]
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,37 @@
 
 from __future__ import annotations
 
+import json
+import os
+import re
+import sys
+import tempfile
+from collections.abc import Sequence, ValuesView
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
-import frontmatter
+import yaml
 
+# Frontmatter block: a leading ``---`` line, the header, and a closing ``---`` line.
+_FRONTMATTER_RE = re.compile(rb"\A---[ \t]*\r?\n(.*?)^---[ \t]*(?:\r?\n|\Z)", re.S | re.M)
 
-@dataclass
+# Keys and unquoted values the flat header scanner accepts verbatim. Anything
+# else (numbers, URLs, comments, flow collections, ...) is left to PyYAML.
+_PLAIN_SCALAR_RE = re.compile(r"[A-Za-z_][\w.\-/ ]*")
+_YAML_KEYWORDS = frozenset({"null", "true", "false", "yes", "no", "on", "off"})
+
+# Parsed definitions are cached per agents directory, keyed by file path and
+# validated against (mtime_ns, size) so unchanged files are never re-read.
+# The cache is plain JSON so loading it can never execute code.
+_CACHE_FILE = Path(".cache") / "agents.json"
+_CACHE_VERSION = 1
+
+_CacheEntries = dict[str, tuple[int, int, "AgentDefinition"]]
+
+
+@dataclass(slots=True, frozen=True)
 class AgentDefinition:
     """Parsed agent definition from a .md file."""
 
@@ -17,9 +41,21 @@ class AgentDefinition:
     llm_provider: str
     llm_model: str | None = None
     implementer: str | None = None
-    capabilities: list[str] = field(default_factory=list)
-    system_prompt: str = ""
+    capabilities: Sequence[str] = ()
     source_path: str = ""
+    body: bytes = field(default=b"", repr=False)  # Raw Markdown body after the frontmatter
+    _system_prompt: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def system_prompt(self) -> str:
+        """The agent's instructions, decoded from the Markdown body on first access."""
+        prompt = self._system_prompt
+        if prompt is None:
+            prompt = self.body.decode("utf-8").strip()
+            # Frozen instances have no __dict__ for cached_property; memoize
+            # into the dedicated slot instead.
+            object.__setattr__(self, "_system_prompt", prompt)
+        return prompt
 
 
 class AgentManager:
@@ -32,49 +68,227 @@ class AgentManager:
     def load_all(self) -> dict[str, AgentDefinition]:
         """Load all .md agent definitions from the agents directory."""
         self._agents.clear()
-        if not self.agents_dir.exists():
-            raise FileNotFoundError(f"Agents directory not found: {self.agents_dir}")
+        try:
+            with os.scandir(self.agents_dir) as it:
+                md_files = [e for e in it if e.name.endswith(".md") and e.is_file()]
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Agents directory not found: {self.agents_dir}") from None
+        md_files.sort(key=lambda e: e.name)
 
-        for md_file in sorted(self.agents_dir.glob("*.md")):
-            agent = self._parse_agent_file(md_file)
+        cached = self._read_cache()
+        stats = {e.path: e.stat() for e in md_files}
+        stale = [
+            path for path, st in stats.items()
+            if cached.get(path, ())[:2] != (st.st_mtime_ns, st.st_size)
+        ]
+
+        # Only files that changed since the cache was written are read, and
+        # their reads overlap in a small thread pool.
+        contents: dict[str, bytes] = {}
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(8, len(stale))) as pool:
+                contents = dict(zip(stale, pool.map(_read_bytes, stale)))
+
+        entries: _CacheEntries = {}
+        for path, st in stats.items():
+            if path in contents:
+                agent = self._parse_agent_data(path, contents[path])
+            else:
+                agent = cached[path][2]
+            entries[path] = (st.st_mtime_ns, st.st_size, agent)
             self._agents[agent.name] = agent
 
+        if entries != cached:
+            self._write_cache(entries)
         return self._agents
 
     def get(self, name: str) -> AgentDefinition:
         """Get a loaded agent by name."""
+        try:
+            return self._agents[name]
+        except KeyError:
+            pass
         if not self._agents:
             self.load_all()
-        if name not in self._agents:
-            available = list(self._agents.keys())
-            raise KeyError(f"Agent '{name}' not found. Available: {available}")
-        return self._agents[name]
+        try:
+            return self._agents[name]
+        except KeyError:
+            raise KeyError(
+                f"Agent '{name}' not found. Available: {list(self._agents)}"
+            ) from None
 
-    def list_agents(self) -> list[AgentDefinition]:
-        """Return all loaded agents."""
+    def list_agents(self) -> ValuesView[AgentDefinition]:
+        """Return a live, read-only view of all loaded agents."""
         if not self._agents:
             self.load_all()
-        return list(self._agents.values())
+        return self._agents.values()
+
+    def _read_cache(self) -> _CacheEntries:
+        try:
+            with open(self.agents_dir / _CACHE_FILE, "rb") as f:
+                data = json.load(f)
+            if data["version"] != _CACHE_VERSION:
+                return {}
+            return {
+                path: (mtime_ns, size, _agent_from_json(fields))
+                for path, (mtime_ns, size, fields) in data["entries"].items()
+            }
+        except Exception:
+            # Missing, unreadable or stale-format caches are simply rebuilt.
+            return {}
+
+    def _write_cache(self, entries: _CacheEntries) -> None:
+        cache_path = self.agents_dir / _CACHE_FILE
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            data = {
+                "version": _CACHE_VERSION,
+                "entries": {
+                    path: [mtime_ns, size, _agent_to_json(agent)]
+                    for path, (mtime_ns, size, agent) in entries.items()
+                },
+            }
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=cache_path.parent, delete=False
+            ) as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(f.name, cache_path)
+        except OSError:
+            # The agents directory may be read-only (e.g. a system install);
+            # caching is an optimisation, so carry on without it.
+            pass
 
-    def _parse_agent_file(self, path: Path) -> AgentDefinition:
+    def _parse_agent_file(self, path: str | os.PathLike[str]) -> AgentDefinition:
         """Parse a single .md agent file."""
-        post = frontmatter.load(str(path))
-        metadata = post.metadata
+        path = os.fspath(path)
+        return self._parse_agent_data(path, _read_bytes(path))
 
-        name = metadata.get("name", path.stem)
-        role = metadata.get("role", name.replace("-", " ").title())
+    def _parse_agent_data(self, path: str, data: bytes) -> AgentDefinition:
+        """Parse the contents of an .md agent file already read into memory."""
+        # Plain Markdown without a header skips the frontmatter machinery.
+        match = _FRONTMATTER_RE.match(data) if data.startswith(b"---") else None
+        if match:
+            metadata = _parse_header(match.group(1).decode("utf-8"))
+            body = data[match.end():]
+        else:
+            metadata = {}
+            body = data
+
+        name = metadata.get("name") or os.path.splitext(os.path.basename(path))[0]
+        role = metadata.get("role")
+        if role is None:
+            role = name.replace("-", " ").title()
         llm_provider = metadata.get("llm_provider", "anthropic")
         llm_model = metadata.get("llm_model")
         implementer = metadata.get("implementer")
-        capabilities = metadata.get("capabilities", [])
+        capabilities = metadata.get("capabilities") or ()
 
-        return AgentDefinition(
+        return _make_agent(
             name=name,
             role=role,
             llm_provider=llm_provider,
             llm_model=llm_model,
             implementer=implementer,
             capabilities=capabilities,
-            system_prompt=post.content.strip(),
-            source_path=str(path),
+            source_path=path,
+            body=body,
         )
+
+
+def _make_agent(**fields: Any) -> AgentDefinition:
+    # Providers, models and capabilities repeat across agents; share one
+    # copy of each string.
+    fields["llm_provider"] = _intern(fields["llm_provider"])
+    fields["llm_model"] = _intern(fields["llm_model"])
+    capabilities = fields["capabilities"]
+    if isinstance(capabilities, list):
+        # An empty list (e.g. read back from the cache) shares the () default.
+        fields["capabilities"] = [_intern(c) for c in capabilities] if capabilities else ()
+    return AgentDefinition(**fields)
+
+
+def _agent_to_json(agent: AgentDefinition) -> dict[str, Any]:
+    return {
+        "name": agent.name,
+        "role": agent.role,
+        "llm_provider": agent.llm_provider,
+        "llm_model": agent.llm_model,
+        "implementer": agent.implementer,
+        "capabilities": list(agent.capabilities),
+        "source_path": agent.source_path,
+        # surrogateescape round-trips bodies that are not valid UTF-8.
+        "body": agent.body.decode("utf-8", "surrogateescape"),
+    }
+
+
+def _agent_from_json(fields: dict[str, Any]) -> AgentDefinition:
+    fields["body"] = fields["body"].encode("utf-8", "surrogateescape")
+    return _make_agent(**fields)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _parse_header(text: str) -> dict[str, Any]:
+    """Parse a flat frontmatter header without going through a YAML loader.
+
+    Handles ``key: value`` lines with plain or simply-quoted scalars and
+    ``key:`` followed by ``- item`` lines. Falls back to ``yaml.safe_load``
+    for anything else, so unusual headers still parse exactly as YAML would.
+    """
+    metadata: dict[str, Any] = {}
+    current_list: list[str] | None = None
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        if current_list is not None and stripped.startswith("- "):
+            item = _parse_scalar(stripped[2:].strip())
+            if item is None:
+                return _parse_header_yaml(text)
+            current_list.append(item)
+            continue
+
+        key, sep, value = line.partition(":")
+        key = key.rstrip()
+        if line[0].isspace() or not sep or not _PLAIN_SCALAR_RE.fullmatch(key):
+            return _parse_header_yaml(text)
+
+        value = value.strip()
+        if not value:
+            current_list = metadata[key] = []
+            continue
+
+        current_list = None
+        scalar = _parse_scalar(value)
+        if scalar is None:
+            return _parse_header_yaml(text)
+        metadata[key] = scalar
+
+    # A bare ``key:`` with no list items is null in YAML.
+    return {k: (v if v != [] else None) for k, v in metadata.items()}
+
+
+def _parse_scalar(value: str) -> str | None:
+    """Return the string value of a simple scalar, or None if YAML is needed."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        inner = value[1:-1]
+        if value[0] in inner or "\\" in inner:
+            return None
+        return inner
+    if _PLAIN_SCALAR_RE.fullmatch(value) and value.lower() not in _YAML_KEYWORDS:
+        return value
+    return None
+
+
+def _parse_header_yaml(text: str) -> dict[str, Any]:
+    data = yaml.safe_load(text)
+    return data if isinstance(data, dict) else {}
@@ -3,35 +3,97 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import functools
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Final
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from ground_control import __version__
-from ground_control.env import load_environment
+from ground_control.cli_agents import agents_app
+from ground_control.cli_tickets import tickets_app
 
-# Load environment variables from .env file at startup
-load_environment()
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(
     name="gc",
     help="Ground Control - AI Agent Orchestration System",
     no_args_is_help=True,
 )
-agents_app = typer.Typer(help="Manage agent definitions")
-tickets_app = typer.Typer(help="Manage project tickets")
-app.add_typer(agents_app, name="agents")
-app.add_typer(tickets_app, name="tickets")
 
-console = Console()
+
+@functools.lru_cache(maxsize=1)
+def _get_console() -> Console:
+    """Build the shared Rich console on first use rather than at import."""
+    from rich.console import Console
+
+    return Console()
+
+
+# Above this many tasks, `status` prints plain lines instead of a Table.
+_STATUS_TABLE_MAX_ROWS = 200
+
+# Rich style names per status. Plain strings keep rich out of import time;
+# Rich caches parsed styles, so per-row lookups stay cheap.
+_RUN_STATUS_STYLES: Final = {
+    "pending": "dim",
+    "planning": "yellow",
+    "running": "blue",
+    "completed": "green",
+    "failed": "red",
+}
+_TASK_STATUS_STYLES: Final = {
+    "pending": "dim",
+    "queued": "yellow",
+    "running": "blue",
+    "completed": "green",
+    "failed": "red",
+    "skipped": "dim",
+}
 
 
 def _run_async(coro):
-    """Run an async coroutine from sync CLI context."""
-    return asyncio.run(coro)
+    """Run an async coroutine from sync CLI context on the shared event loop."""
+    return _get_loop().run_until_complete(coro)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Create the process-wide event loop (uvloop when installed) and close it at exit."""
+    try:
+        import uvloop
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    else:
+        loop = uvloop.new_event_loop()
+    asyncio.set_event_loop(loop)
+    atexit.register(_close_loop, loop)
+    return loop
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+@app.callback()
+def _main():
+    """Ground Control - AI Agent Orchestration System"""
+    # Runs only once a command has been resolved, so --help and shell
+    # completion never touch .env files or import python-dotenv. The marker
+    # is inherited by child processes, which then skip loading again.
+    if os.environ.get("GC_ENV_LOADED"):
+        return
+    from ground_control.env import load_environment
+
+    load_environment()
+    os.environ["GC_ENV_LOADED"] = "1"
 
 
 # ── Top-level commands ────────────────────────────────────────────────
@@ -42,7 +104,11 @@ def run(
     project: str = typer.Argument(..., help="Project name to run"),
 ):
     """Execute an orchestration run for a project."""
+    console = _get_console()
+
     async def _run():
+        from rich.panel import Panel
+
         from ground_control.config import get_base_dir, find_project_config, load_project_config
         from ground_control.env import check_required_keys
         from ground_control.implementers import get_implementer
@@ -112,6 +178,8 @@ def resume(
     retry_failed: bool = typer.Option(False, "--retry-failed", help="Retry failed tasks in addition to pending ones"),
 ):
     """Resume an incomplete or failed run, re-executing pending tasks."""
+    console = _get_console()
+
     async def _resume():
         from ground_control.config import get_base_dir
         from ground_control.orchestrator import Orchestrator
@@ -154,81 +222,90 @@ def status(
     run_id: str = typer.Option(None, "--run-id", "-r", help="Specific run ID (defaults to latest)"),
 ):
     """Show the status of a project's runs and tasks."""
+    console = _get_console()
+
     async def _status():
-        from ground_control.config import get_base_dir
-        from ground_control.state import StateStore
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.text import Text
 
-        base = get_base_dir()
-        state = StateStore(base / "ground_control.db")
+        from ground_control.config_lite import get_paths
+        from ground_control.state import StateStore, iso
+
+        state = StateStore(get_paths().db_path)
         await state.initialize()
 
         try:
             if run_id:
-                summary = await state.get_run_summary(run_id)
+                summary = await state.get_run_summary(run_id, include_tasks=True)
             else:
                 runs = await state.list_runs(project_name=project, limit=1)
                 if not runs:
                     console.print(f"[yellow]No runs found for project '{project}'[/]")
                     return
-                summary = await state.get_run_summary(runs[0]["id"])
+                summary = await state.get_run_summary(runs[0]["id"], include_tasks=True)
 
             run_info = summary["run"]
             if not run_info:
                 console.print("[yellow]Run not found[/]")
                 return
 
-            status_color = {
-                "pending": "dim",
-                "planning": "yellow",
-                "running": "blue",
-                "completed": "green",
-                "failed": "red",
-            }.get(run_info["status"], "white")
+            status_color = _RUN_STATUS_STYLES.get(run_info["status"], "white")
 
-            console.print(Panel(
+            # Everything is collected into one Group and rendered in a single
+            # print, so the console is measured and flushed once.
+            parts = [Panel(
                 f"[bold]Run:[/] {run_info['id']}\n"
                 f"[bold]Project:[/] {run_info['project_name']}\n"
                 f"[bold]Status:[/] [{status_color}]{run_info['status']}[/{status_color}]\n"
-                f"[bold]Created:[/] {run_info['created_at']}\n"
+                f"[bold]Created:[/] {iso(run_info['created_at'])}\n"
                 f"[bold]Tasks:[/] {summary['total_tasks']}",
                 title="[bold cyan]Run Status[/]",
                 border_style="cyan",
-            ))
+            )]
 
             if summary["status_counts"]:
                 counts_table = Table(title="Task Summary")
                 counts_table.add_column("Status", style="bold")
                 counts_table.add_column("Count", justify="right")
                 for s, count in sorted(summary["status_counts"].items()):
-                    counts_table.add_row(s, str(count))
-                console.print(counts_table)
+                    counts_table.add_row(Text(s), Text(str(count)))
+                parts.append(counts_table)
 
             if summary["tasks"]:
+                if len(summary["tasks"]) > _STATUS_TABLE_MAX_ROWS:
+                    # A Table measures every cell before rendering anything;
+                    # for large runs print fixed-width lines as we go instead.
+                    parts.append(Text("Tasks", style="italic"))
+                    console.print(Group(*parts))
+                    for task in summary["tasks"]:
+                        ts = task["status"]
+                        line = Text(
+                            f"{task['id']:<20.20} {task['title']:<32.32} "
+                            f"{task.get('assigned_agent') or '-':<16.16} "
+                        )
+                        line.append(ts, style=_TASK_STATUS_STYLES.get(ts, "white"))
+                        console.print(line, no_wrap=True, overflow="ellipsis")
+                    return
+
                 tasks_table = Table(title="Tasks")
                 tasks_table.add_column("ID", style="dim", max_width=20)
                 tasks_table.add_column("Title")
                 tasks_table.add_column("Agent", style="cyan")
                 tasks_table.add_column("Status")
 
-                status_styles = {
-                    "pending": "dim",
-                    "queued": "yellow",
-                    "running": "blue",
-                    "completed": "green",
-                    "failed": "red",
-                    "skipped": "dim",
-                }
-
                 for task in summary["tasks"]:
                     ts = task["status"]
-                    style = status_styles.get(ts, "white")
                     tasks_table.add_row(
                         task["id"],
                         task["title"],
                         task.get("assigned_agent", "-"),
-                        f"[{style}]{ts}[/{style}]",
+                        Text(ts, style=_TASK_STATUS_STYLES.get(ts, "white")),
                     )
-                console.print(tasks_table)
+                parts.append(tasks_table)
+
+            console.print(Group(*parts))
 
         finally:
             await state.close()
@@ -239,6 +316,8 @@ def status(
 @app.command()
 def test_cursor():
     """Test if Cursor CLI is working properly."""
+    console = _get_console()
+
     async def _test():
         from ground_control.implementers.cursor_cli import CursorCLIImplementer
         import tempfile
@@ -275,7 +354,9 @@ def test_cursor():
 @app.command()
 def version():
     """Show Ground Control version."""
-    console.print(f"[bold cyan]Ground Control[/] v{__version__}")
+    from ground_control import __version__
+
+    print(f"Ground Control v{__version__}")
 
 
 @app.command()
@@ -283,12 +364,12 @@ def clean(
     confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt"),
 ):
     """Delete the database and reset all run history."""
-    from ground_control.config import get_base_dir
-    
-    base = get_base_dir()
-    db_path = base / "ground_control.db"
+    from ground_control.config_lite import get_paths
+
+    console = _get_console()
+    db_path = get_paths().db_path
     
-    if not db_path.exists():
+    if not os.path.isfile(db_path):
         console.print(f"[yellow]No database found at {db_path}[/]")
         return
     
@@ -301,6 +382,9 @@ def clean(
             raise typer.Exit(0)
     
     db_path.unlink()
+    # WAL sidecar files, left behind if a run was interrupted.
+    for suffix in ("-wal", "-shm"):
+        db_path.with_name(db_path.name + suffix).unlink(missing_ok=True)
     console.print(f"[green]✓[/] Database deleted: {db_path}")
     console.print("[dim]The database will be recreated automatically on next run.[/]")
 
@@ -310,7 +394,13 @@ def check(
     project: str = typer.Argument(..., help="Project name to check"),
 ):
     """Check if all requirements are met to run a project."""
+    console = _get_console()
+
     async def _check():
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.text import Text
+
         from ground_control.config import get_base_dir, find_project_config, load_project_config
         from ground_control.env import check_required_keys
         from ground_control.implementers import get_implementer
@@ -325,6 +415,16 @@ def check(
         base = get_base_dir()
         
         checks = []
+
+        def _checks_grid():
+            # Icons are styled per row; messages are plain Text, so paths or
+            # brackets in them are never parsed as markup.
+            grid = Table.grid(padding=(0, 1))
+            grid.add_column()
+            grid.add_column()
+            for icon, color, msg in checks:
+                grid.add_row(Text(icon, style=color), Text(msg))
+            return grid
         
         # Check 1: Project config exists
         try:
@@ -333,67 +433,75 @@ def check(
             checks.append(("✓", "green", f"Project config found: {project_path.name}"))
         except FileNotFoundError as e:
             checks.append(("✗", "red", f"Project config not found: {e}"))
-            console.print("\n".join([f"[{color}]{icon}[/{color}] {msg}" for icon, color, msg in checks]))
+            console.print(_checks_grid())
             raise typer.Exit(1)
         
-        # Check 2: Repo path exists
-        repo_path = Path(project_config.repo_path)
-        if repo_path.exists():
-            checks.append(("✓", "green", f"Repo path exists: {project_config.repo_path}"))
-        else:
-            checks.append(("✗", "red", f"Repo path not found: {project_config.repo_path}"))
-        
-        # Check 3: API key
-        provider = project_config.settings.llm_provider
-        key_status = check_required_keys([provider])
-        if key_status[provider]:
-            checks.append(("✓", "green", f"API key set for {provider}"))
-        else:
-            checks.append(("✗", "red", f"API key missing for {provider} (set {provider.upper()}_API_KEY)"))
-        
-        # Check 4: Implementer CLI
-        implementer_name = project_config.settings.implementer
-        implementer = get_implementer(implementer_name)
-        if await implementer.is_available():
-            checks.append(("✓", "green", f"Implementer '{implementer_name}' is installed"))
-        else:
+        # The remaining probes are independent; run them concurrently, with
+        # filesystem work pushed to threads so it doesn't block the loop.
+        def _check_repo():
+            repo_path = Path(project_config.repo_path)
+            if repo_path.exists():
+                return ("✓", "green", f"Repo path exists: {project_config.repo_path}")
+            return ("✗", "red", f"Repo path not found: {project_config.repo_path}")
+
+        async def _check_api_key():
+            provider = project_config.settings.llm_provider
+            key_status = check_required_keys([provider])
+            if key_status[provider]:
+                return ("✓", "green", f"API key set for {provider}")
+            return ("✗", "red", f"API key missing for {provider} (set {provider.upper()}_API_KEY)")
+
+        async def _check_implementer():
+            implementer_name = project_config.settings.implementer
+            implementer = get_implementer(implementer_name)
+            if await implementer.is_available():
+                return ("✓", "green", f"Implementer '{implementer_name}' is installed")
             install_instructions = {
                 "cursor_cli": "brew install cursor (macOS) or https://cursor.com",
                 "claude_code": "npm install -g @anthropic-ai/claude-code",
             }
             instruction = install_instructions.get(implementer_name, "Install required CLI")
-            checks.append(("✗", "red", f"Implementer '{implementer_name}' not found ({instruction})"))
-        
-        # Check 5: Agents
-        agent_manager = AgentManager(base / "agents")
-        try:
-            agent_manager.load_all()
+            return ("✗", "red", f"Implementer '{implementer_name}' not found ({instruction})")
+
+        def _check_agents():
+            agent_manager = AgentManager(base / "agents")
+            try:
+                agent_manager.load_all()
+            except FileNotFoundError:
+                return ("✗", "red", f"Agents directory not found: {base / 'agents'}")
             missing_agents = [a for a in project_config.agents if a not in agent_manager._agents]
             if not missing_agents:
-                checks.append(("✓", "green", f"All {len(project_config.agents)} required agents found"))
-            else:
-                checks.append(("✗", "red", f"Missing agents: {', '.join(missing_agents)}"))
-        except FileNotFoundError:
-            checks.append(("✗", "red", f"Agents directory not found: {base / 'agents'}"))
-        
-        # Check 6: Tickets
-        ticket_path = Path(project_config.ticket_source.path)
-        if not ticket_path.is_absolute():
-            ticket_path = base / ticket_path
-        
-        if ticket_path.exists():
-            yaml_files = list(ticket_path.glob("*.yaml")) + list(ticket_path.glob("*.yml"))
-            if yaml_files:
-                checks.append(("✓", "green", f"Tickets found: {len(yaml_files)} file(s)"))
-            else:
-                checks.append(("⚠", "yellow", f"Ticket directory exists but empty: {ticket_path}"))
-        else:
-            checks.append(("⚠", "yellow", f"Ticket directory not found: {ticket_path}"))
-        
+                return ("✓", "green", f"All {len(project_config.agents)} required agents found")
+            return ("✗", "red", f"Missing agents: {', '.join(missing_agents)}")
+
+        def _check_tickets():
+            ticket_path = Path(project_config.ticket_source.path)
+            if not ticket_path.is_absolute():
+                ticket_path = base / ticket_path
+
+            # One directory read covers both extensions.
+            try:
+                with os.scandir(ticket_path) as it:
+                    yaml_count = sum(
+                        1 for e in it if e.name.endswith((".yaml", ".yml")) and e.is_file()
+                    )
+            except (FileNotFoundError, NotADirectoryError):
+                return ("⚠", "yellow", f"Ticket directory not found: {ticket_path}")
+            if yaml_count:
+                return ("✓", "green", f"Tickets found: {yaml_count} file(s)")
+            return ("⚠", "yellow", f"Ticket directory exists but empty: {ticket_path}")
+
+        checks += await asyncio.gather(
+            asyncio.to_thread(_check_repo),
+            _check_api_key(),
+            _check_implementer(),
+            asyncio.to_thread(_check_agents),
+            asyncio.to_thread(_check_tickets),
+        )
+
         # Print all checks
         console.print()
-        for icon, color, msg in checks:
-            console.print(f"[{color}]{icon}[/{color}] {msg}")
+        console.print(_checks_grid())
         
         # Summary
         errors = sum(1 for _, color, _ in checks if color == "red")
@@ -420,104 +528,10 @@ def check(
     _run_async(_check())
 
 
-# ── Agents subcommands ────────────────────────────────────────────────
-
-
-@agents_app.command("list")
-def agents_list(
-):
-    """List all available agent definitions."""
-    from ground_control.agent_manager import AgentManager
-    from ground_control.config import get_base_dir
-
-    base = get_base_dir()
-    manager = AgentManager(base / "agents")
-
-    try:
-        agents = manager.load_all()
-    except FileNotFoundError:
-        console.print("[red]Agents directory not found.[/]")
-        raise typer.Exit(1)
-
-    if not agents:
-        console.print("[yellow]No agents found.[/]")
-        return
-
-    table = Table(title="Available Agents")
-    table.add_column("Name", style="bold cyan")
-    table.add_column("Role")
-    table.add_column("LLM Provider")
-    table.add_column("Implementer")
-    table.add_column("Capabilities")
-
-    for agent in agents.values():
-        table.add_row(
-            agent.name,
-            agent.role,
-            f"{agent.llm_provider}" + (f" ({agent.llm_model})" if agent.llm_model else ""),
-            agent.implementer or "-",
-            ", ".join(agent.capabilities) if agent.capabilities else "-",
-        )
-
-    console.print(table)
-
-
-# ── Tickets subcommands ───────────────────────────────────────────────
-
-
-@tickets_app.command("list")
-def tickets_list(
-    project: str = typer.Argument(..., help="Project name"),
-):
-    """List tickets for a project."""
-    async def _list():
-        from ground_control.config import get_base_dir, find_project_config, load_project_config
-        from ground_control.ticket_sources import get_ticket_source
-
-        base = get_base_dir()
-
-        try:
-            project_path = find_project_config(project, base / "projects")
-        except FileNotFoundError as e:
-            console.print(f"[red]{e}[/]")
-            raise typer.Exit(1)
-
-        project_config = load_project_config(project_path)
-        source = get_ticket_source(
-            project_config.ticket_source.type,
-            path=project_config.ticket_source.path,
-        )
+# ── Subcommand groups ─────────────────────────────────────────────────
 
-        tickets = await source.load_tickets()
-
-        if not tickets:
-            console.print(f"[yellow]No tickets found for project '{project}'[/]")
-            return
-
-        table = Table(title=f"Tickets - {project}")
-        table.add_column("ID", style="bold")
-        table.add_column("Title")
-        table.add_column("Priority")
-        table.add_column("Status")
-        table.add_column("Labels")
-
-        priority_styles = {"high": "red", "medium": "yellow", "low": "green"}
-        status_styles = {"open": "cyan", "in_progress": "blue", "done": "green", "blocked": "red"}
-
-        for ticket in tickets:
-            p_style = priority_styles.get(ticket.priority.value, "white")
-            s_style = status_styles.get(ticket.status.value, "white")
-            table.add_row(
-                ticket.id,
-                ticket.title,
-                f"[{p_style}]{ticket.priority.value}[/{p_style}]",
-                f"[{s_style}]{ticket.status.value}[/{s_style}]",
-                ", ".join(ticket.labels) if ticket.labels else "-",
-            )
-
-        console.print(table)
-
-    _run_async(_list())
+app.add_typer(agents_app, name="agents")
+app.add_typer(tickets_app, name="tickets")
 
 
 if __name__ == "__main__":
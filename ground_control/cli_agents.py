@@ -0,0 +1,49 @@
+"""``gctl agents`` subcommands."""
+
+from __future__ import annotations
+
+import typer
+
+agents_app = typer.Typer(help="Manage agent definitions")
+
+
+@agents_app.command("list")
+def agents_list(
+):
+    """List all available agent definitions."""
+    from rich.table import Table
+
+    from ground_control.agent_manager import AgentManager
+    from ground_control.cli import _get_console
+    from ground_control.config_lite import get_paths
+
+    console = _get_console()
+    manager = AgentManager(get_paths().agents_dir)
+
+    try:
+        agents = manager.load_all()
+    except FileNotFoundError:
+        console.print("[red]Agents directory not found.[/]")
+        raise typer.Exit(1)
+
+    if not agents:
+        console.print("[yellow]No agents found.[/]")
+        return
+
+    table = Table(title="Available Agents")
+    table.add_column("Name", style="bold cyan")
+    table.add_column("Role")
+    table.add_column("LLM Provider")
+    table.add_column("Implementer")
+    table.add_column("Capabilities")
+
+    for agent in agents.values():
+        table.add_row(
+            agent.name,
+            agent.role,
+            f"{agent.llm_provider}" + (f" ({agent.llm_model})" if agent.llm_model else ""),
+            agent.implementer or "-",
+            ", ".join(agent.capabilities) if agent.capabilities else "-",
+        )
+
+    console.print(table)
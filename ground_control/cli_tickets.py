@@ -0,0 +1,80 @@
+"""``gctl tickets`` subcommands."""
+
+from __future__ import annotations
+
+from typing import Final
+
+import typer
+
+tickets_app = typer.Typer(help="Manage project tickets")
+
+_PRIORITY_STYLES: Final = {
+    "high": "red",
+    "medium": "yellow",
+    "low": "green",
+}
+_TICKET_STATUS_STYLES: Final = {
+    "open": "cyan",
+    "in_progress": "blue",
+    "done": "green",
+    "blocked": "red",
+}
+
+
+@tickets_app.command("list")
+def tickets_list(
+    project: str = typer.Argument(..., help="Project name"),
+):
+    """List tickets for a project."""
+    from ground_control.cli import _get_console, _run_async
+
+    console = _get_console()
+
+    async def _list():
+        from rich.table import Table
+        from rich.text import Text
+
+        from ground_control.config import get_base_dir, find_project_config, load_project_config
+        from ground_control.ticket_sources import get_ticket_source
+
+        base = get_base_dir()
+
+        try:
+            project_path = find_project_config(project, base / "projects")
+        except FileNotFoundError as e:
+            console.print(f"[red]{e}[/]")
+            raise typer.Exit(1)
+
+        project_config = load_project_config(project_path)
+        source = get_ticket_source(
+            project_config.ticket_source.type,
+            path=project_config.ticket_source.path,
+        )
+
+        tickets = await source.load_tickets()
+
+        if not tickets:
+            console.print(f"[yellow]No tickets found for project '{project}'[/]")
+            return
+
+        table = Table(title=f"Tickets - {project}")
+        table.add_column("ID", style="bold")
+        table.add_column("Title")
+        table.add_column("Priority")
+        table.add_column("Status")
+        table.add_column("Labels")
+
+        for ticket in tickets:
+            priority = ticket.priority.value
+            ticket_status = ticket.status.value
+            table.add_row(
+                ticket.id,
+                ticket.title,
+                Text(priority, style=_PRIORITY_STYLES.get(priority, "white")),
+                Text(ticket_status, style=_TICKET_STATUS_STYLES.get(ticket_status, "white")),
+                ", ".join(ticket.labels) if ticket.labels else "-",
+            )
+
+        console.print(table)
+
+    _run_async(_list())
@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import functools
+import json
+import os
+import tempfile
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
 
+from ground_control.config_lite import get_base_dir  # noqa: F401  (re-exported)
+
+# libyaml's loader is several times faster; fall back when PyYAML lacks it.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed configs are also cached as JSON, which loads much faster than YAML.
+_SIDECAR_DIR = ".cache"
+
 
 class TicketSourceConfig(BaseModel):
     type: str = "local_yaml"
@@ -19,6 +31,12 @@ class ProjectSettings(BaseModel):
     implementer: str = "claude_code"
     llm_provider: str = "anthropic"
     llm_model: str | None = None  # If None, uses provider's default
+    llm_cache: bool = False  # Reuse low-temperature LLM responses across runs
+    llm_rpm: int | None = Field(default=None, ge=1)  # Client-side request budget per minute
+    llm_tpm: int | None = Field(default=None, ge=1)  # Client-side token budget per minute
+    llm_low_level: bool = False  # Call the HTTP API directly instead of through the SDK
+    max_planning_input_tokens: int = Field(default=6000, ge=1)  # Truncate tickets beyond this
+    phase_timeout: float | None = Field(default=None, gt=0)  # Seconds for ticket loading / planning
 
 
 class ProjectStructure(BaseModel):
@@ -46,34 +64,73 @@ class ProjectConfig(BaseModel):
         return str(path)
 
 
-def get_base_dir() -> Path:
-    """Return the ground-control package root directory."""
-    return Path(__file__).resolve().parent.parent
-
-
 def load_project_config(path: str | Path) -> ProjectConfig:
     """Load and validate a project config from a YAML file."""
     path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Project config not found: {path}")
-
-    with open(path) as f:
-        data: dict[str, Any] = yaml.safe_load(f)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Project config not found: {path}") from None
 
+    data: dict[str, Any] = _load_yaml(str(path), mtime_ns)
     return ProjectConfig(**data)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML file, memoized per (path, mtime) for the life of the process.
+
+    Across processes, the parsed data is kept in a JSON sidecar under a
+    ``.cache`` directory next to the file and reused while the mtime matches.
+    Callers must not mutate the result; ProjectConfig copies it on validation.
+    """
+    sidecar = os.path.join(
+        os.path.dirname(path), _SIDECAR_DIR, os.path.basename(path) + ".json"
+    )
+    try:
+        with open(sidecar, "rb") as f:
+            cached = json.load(f)
+        if cached["mtime_ns"] == mtime_ns:
+            return cached["data"]
+    except Exception:
+        # Missing, unreadable or stale-format sidecars are simply rebuilt.
+        pass
+
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_SafeLoader)
+    _write_sidecar(sidecar, {"mtime_ns": mtime_ns, "data": data})
+    return data
+
+
+def _write_sidecar(sidecar: str, payload: dict[str, Any]) -> None:
+    try:
+        encoded = json.dumps(payload, separators=(",", ":"))
+    except (TypeError, ValueError):
+        # YAML-only types (dates, sets, ...) have no JSON form; skip caching.
+        return
+    try:
+        os.makedirs(os.path.dirname(sidecar), exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=os.path.dirname(sidecar), delete=False
+        ) as f:
+            f.write(encoded)
+        os.replace(f.name, sidecar)
+    except OSError:
+        # A read-only projects directory just means no sidecar.
+        pass
+
+
 def find_project_config(project_name: str, projects_dir: str | Path) -> Path:
     """Find a project config file by name in the projects directory."""
-    projects_dir = Path(projects_dir)
+    base = os.fspath(projects_dir)
     candidates = [
-        projects_dir / f"{project_name}.yaml",
-        projects_dir / f"{project_name}.yml",
+        os.path.join(base, f"{project_name}.yaml"),
+        os.path.join(base, f"{project_name}.yml"),
     ]
     for candidate in candidates:
-        if candidate.exists():
-            return candidate
+        if os.path.isfile(candidate):
+            return Path(candidate)
     raise FileNotFoundError(
-        f"No config found for project '{project_name}' in {projects_dir}. "
-        f"Looked for: {[str(c) for c in candidates]}"
+        f"No config found for project '{project_name}' in {base}. "
+        f"Looked for: {candidates}"
     )
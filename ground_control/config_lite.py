@@ -0,0 +1,31 @@
+"""Workspace path layout, importable without pulling in pydantic."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import NamedTuple
+
+
+class GCPaths(NamedTuple):
+    """Locations of the agents, projects and state database."""
+
+    base_dir: Path
+    agents_dir: Path
+    projects_dir: Path
+    db_path: Path
+
+
+def get_base_dir() -> Path:
+    """Return the ground-control package root directory."""
+    return Path(__file__).resolve().parent.parent
+
+
+def get_paths() -> GCPaths:
+    """Return the standard workspace paths under the base directory."""
+    base = get_base_dir()
+    return GCPaths(
+        base_dir=base,
+        agents_dir=base / "agents",
+        projects_dir=base / "projects",
+        db_path=base / "ground_control.db",
+    )
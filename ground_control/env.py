@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
-from dotenv import load_dotenv
+_KEY_MAP = {
+    "anthropic": "ANTHROPIC_API_KEY",
+    "openai": "OPENAI_API_KEY",
+}
+# Each provider also accepts a comma-separated <VAR>S list (see get_api_keys).
+_ALL_KEY_VARS = (*_KEY_MAP.values(), *(f"{var}S" for var in _KEY_MAP.values()))
 
 
 def load_environment(workspace_dir: str | Path | None = None) -> None:
@@ -15,7 +21,19 @@ def load_environment(workspace_dir: str | Path | None = None) -> None:
     1. The specified workspace_dir
     2. Current working directory
     3. Ground control package directory
+
+    Skipped entirely when all provider key variables are already set or
+    ``GC_SKIP_DOTENV`` is set.
     """
+    # Keys may be about to change; forget what was seen before.
+    _api_key_is_set.cache_clear()
+
+    # Nothing to gain from reading .env files when every key variable,
+    # single and multi-key, is already exported (typical in CI and
+    # containers) or the caller opted out.
+    if os.environ.get("GC_SKIP_DOTENV") or all(k in os.environ for k in _ALL_KEY_VARS):
+        return
+
     search_paths = []
     
     if workspace_dir:
@@ -29,6 +47,8 @@ def load_environment(workspace_dir: str | Path | None = None) -> None:
     
     for env_path in search_paths:
         if env_path.exists():
+            from dotenv import load_dotenv
+
             load_dotenv(env_path, override=False)
             return
     
@@ -44,21 +64,38 @@ def get_api_key(provider: str) -> str | None:
     Returns:
         API key or None if not set
     """
-    key_map = {
-        "anthropic": "ANTHROPIC_API_KEY",
-        "openai": "OPENAI_API_KEY",
-    }
-    
-    env_var = key_map.get(provider.lower())
+    keys = get_api_keys(provider)
+    return keys[0] if keys else None
+
+
+def get_api_keys(provider: str) -> list[str]:
+    """Get every API key configured for a provider.
+
+    ``<PROVIDER>_API_KEYS`` may hold a comma-separated list of keys (e.g. for
+    several accounts) that providers rotate through; otherwise this is the
+    single ``<PROVIDER>_API_KEY``, if set.
+    """
+    env_var = _KEY_MAP.get(provider.lower())
     if not env_var:
-        return None
-    
-    return os.getenv(env_var)
+        return []
+
+    keys = [k.strip() for k in os.environ.get(f"{env_var}S", "").split(",") if k.strip()]
+    if keys:
+        return keys
+    key = os.environ.get(env_var)
+    return [key] if key else []
+
+
+@functools.lru_cache(maxsize=None)
+def _api_key_is_set(provider: str) -> bool:
+    return bool(get_api_key(provider))
 
 
 def check_required_keys(providers: list[str]) -> dict[str, bool]:
     """Check if required API keys are set.
     
+    Results are memoized per process; load_environment() resets them.
+
     Args:
         providers: List of provider names to check
     
@@ -66,6 +103,6 @@ def check_required_keys(providers: list[str]) -> dict[str, bool]:
         Dict mapping provider name to whether key is set
     """
     return {
-        provider: bool(get_api_key(provider))
+        provider: _api_key_is_set(provider)
         for provider in providers
     }
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import shutil
 from dataclasses import dataclass
 
+# PATH lookups per command name; installed tools don't come and go mid-run.
+_which_cache: dict[str, bool] = {}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ImplementerResult:
     """Result from an implementer execution."""
 
@@ -42,3 +47,30 @@ class BaseImplementer(abc.ABC):
     async def is_available(self) -> bool:
         """Check if this implementer's CLI tool is installed and accessible."""
         ...
+
+
+async def command_available(command: str) -> bool:
+    """Return whether ``command`` is on PATH, walking PATH at most once per process."""
+    try:
+        return _which_cache[command]
+    except KeyError:
+        pass
+    found = await asyncio.to_thread(shutil.which, command) is not None
+    _which_cache[command] = found
+    return found
+
+
+async def reap_process(proc: asyncio.subprocess.Process, tasks=()) -> None:
+    """Kill ``proc`` if it is still running, wait for it, and cancel its reader ``tasks``.
+
+    Meant for a ``finally`` block, so a cancelled run or an unexpected error
+    never leaves the child process (and its pipes) behind.
+    """
+    for task in tasks:
+        task.cancel()
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        await proc.wait()
@@ -4,16 +4,22 @@ from __future__ import annotations
 
 import asyncio
 import os
-import shutil
 import sys
+from collections import deque
 
-from ground_control.implementers.base import BaseImplementer, ImplementerResult
+from ground_control.implementers.base import (
+    BaseImplementer,
+    ImplementerResult,
+    command_available,
+    reap_process,
+)
 
 
 class ClaudeCodeImplementer(BaseImplementer):
     """Executes tasks via the Claude Code CLI (claude command)."""
 
     COMMAND = "claude"
+    MAX_CAPTURE_CHARS = 8 * 1024 * 1024  # Per stream; older lines are dropped beyond this
 
     async def execute(
         self,
@@ -47,10 +53,13 @@ class ClaudeCodeImplementer(BaseImplementer):
             )
 
             # Stream output in real-time
-            stdout_lines = []
-            stderr_lines = []
-            
+            # Only the most recent MAX_CAPTURE_CHARS of each stream are kept
+            # so long sessions can't grow memory without bound.
+            stdout_lines: deque[str] = deque()
+            stderr_lines: deque[str] = deque()
+
             async def read_stream(stream, prefix, lines_collector):
+                captured = 0
                 try:
                     while True:
                         line = await stream.readline()
@@ -60,6 +69,9 @@ class ClaudeCodeImplementer(BaseImplementer):
                         if text:  # Only print non-empty lines
                             print(f"{prefix} {text}", flush=True)
                             lines_collector.append(text)
+                            captured += len(text)
+                            while captured > self.MAX_CAPTURE_CHARS and len(lines_collector) > 1:
+                                captured -= len(lines_collector.popleft())
                 except Exception as e:
                     print(f"{prefix} Stream error: {e}", flush=True)
             
@@ -69,37 +81,41 @@ class ClaudeCodeImplementer(BaseImplementer):
                 asyncio.create_task(read_stream(proc.stderr, "[Claude ERR]", stderr_lines)),
             ]
             
-            # Wait for process to complete with timeout
             try:
-                return_code = await asyncio.wait_for(proc.wait(), timeout=600)
-            except asyncio.TimeoutError:
-                print("[Claude Code] Timeout reached, terminating process...", file=sys.stderr)
-                proc.terminate()
+                # Wait for process to complete with timeout
                 try:
-                    await asyncio.wait_for(proc.wait(), timeout=5)
+                    return_code = await asyncio.wait_for(proc.wait(), timeout=600)
                 except asyncio.TimeoutError:
-                    proc.kill()
-                raise
+                    print("[Claude Code] Timeout reached, terminating process...", file=sys.stderr)
+                    proc.terminate()
+                    try:
+                        await asyncio.wait_for(proc.wait(), timeout=5)
+                    except asyncio.TimeoutError:
+                        proc.kill()
+                    raise
             
-            # Give stream readers a moment to finish
-            await asyncio.wait(read_tasks, timeout=2)
-
-            stdout_text = "\n".join(stdout_lines)
-            stderr_text = "\n".join(stderr_lines)
-
-            print(f"\n[Claude Code] Process exited with code {return_code}\n")
-
-            if return_code == 0:
-                return ImplementerResult(
-                    success=True,
-                    output=stdout_text,
-                )
-            else:
-                return ImplementerResult(
-                    success=False,
-                    output=stdout_text,
-                    error=f"Claude Code exited with code {return_code}: {stderr_text}",
-                )
+                # Give stream readers a moment to finish
+                await asyncio.wait(read_tasks, timeout=2)
+
+                stdout_text = "\n".join(stdout_lines)
+                stderr_text = "\n".join(stderr_lines)
+
+                print(f"\n[Claude Code] Process exited with code {return_code}\n")
+
+                if return_code == 0:
+                    return ImplementerResult(
+                        success=True,
+                        output=stdout_text,
+                    )
+                else:
+                    return ImplementerResult(
+                        success=False,
+                        output=stdout_text,
+                        error=f"Claude Code exited with code {return_code}: {stderr_text}",
+                    )
+
+            finally:
+                await reap_process(proc, read_tasks)
 
         except asyncio.TimeoutError:
             print("[Claude Code] Execution timed out after 600 seconds", file=sys.stderr)
@@ -115,4 +131,4 @@ class ClaudeCodeImplementer(BaseImplementer):
             )
 
     async def is_available(self) -> bool:
-        return shutil.which(self.COMMAND) is not None
+        return await command_available(self.COMMAND)
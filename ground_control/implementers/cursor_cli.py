@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-import shutil
 import sys
 import time
 
-from ground_control.implementers.base import BaseImplementer, ImplementerResult
+from ground_control.implementers.base import (
+    BaseImplementer,
+    ImplementerResult,
+    command_available,
+    reap_process,
+)
 
 
 class CursorCLIImplementer(BaseImplementer):
@@ -115,51 +119,55 @@ class CursorCLIImplementer(BaseImplementer):
                 asyncio.create_task(read_stream(proc.stderr, "[Cursor ERR]", stderr_lines)),
             ]
             
-            # Wait for process to complete with timeout
             try:
-                return_code = await asyncio.wait_for(proc.wait(), timeout=600)
-            except asyncio.TimeoutError:
-                elapsed = time.time() - start_time
-                print(f"[Cursor CLI] Timeout after {elapsed:.1f}s, terminating process...", file=sys.stderr)
-                proc.terminate()
+                # Wait for process to complete with timeout
                 try:
-                    await asyncio.wait_for(proc.wait(), timeout=5)
+                    return_code = await asyncio.wait_for(proc.wait(), timeout=600)
                 except asyncio.TimeoutError:
-                    proc.kill()
-                    await proc.wait()
+                    elapsed = time.time() - start_time
+                    print(f"[Cursor CLI] Timeout after {elapsed:.1f}s, terminating process...", file=sys.stderr)
+                    proc.terminate()
+                    try:
+                        await asyncio.wait_for(proc.wait(), timeout=5)
+                    except asyncio.TimeoutError:
+                        proc.kill()
+                        await proc.wait()
                 
-                # Collect any remaining output
-                await asyncio.wait(read_tasks, timeout=2)
-                stderr_text = "\n".join(stderr_lines)
+                    # Collect any remaining output
+                    await asyncio.wait(read_tasks, timeout=2)
+                    stderr_text = "\n".join(stderr_lines)
                 
-                return ImplementerResult(
-                    success=False,
-                    error=f"Cursor Agent timed out after {elapsed:.1f}s. Last stderr: {stderr_text[-500:] if stderr_text else 'none'}",
-                )
+                    return ImplementerResult(
+                        success=False,
+                        error=f"Cursor Agent timed out after {elapsed:.1f}s. Last stderr: {stderr_text[-500:] if stderr_text else 'none'}",
+                    )
             
-            # Give stream readers a moment to finish
-            await asyncio.wait(read_tasks, timeout=2)
-
-            stdout_text = "\n".join(stdout_lines)
-            stderr_text = "\n".join(stderr_lines)
-            elapsed = time.time() - start_time
+                # Give stream readers a moment to finish
+                await asyncio.wait(read_tasks, timeout=2)
 
-            print(f"\n[Cursor CLI] Process exited with code {return_code} after {elapsed:.1f}s\n")
+                stdout_text = "\n".join(stdout_lines)
+                stderr_text = "\n".join(stderr_lines)
+                elapsed = time.time() - start_time
 
-            if return_code == 0:
-                return ImplementerResult(
-                    success=True,
-                    output=stdout_text,
-                )
-            else:
-                error_msg = f"Cursor Agent exited with code {return_code}"
-                if stderr_text:
-                    error_msg += f": {stderr_text}"
-                return ImplementerResult(
-                    success=False,
-                    output=stdout_text,
-                    error=error_msg,
-                )
+                print(f"\n[Cursor CLI] Process exited with code {return_code} after {elapsed:.1f}s\n")
+
+                if return_code == 0:
+                    return ImplementerResult(
+                        success=True,
+                        output=stdout_text,
+                    )
+                else:
+                    error_msg = f"Cursor Agent exited with code {return_code}"
+                    if stderr_text:
+                        error_msg += f": {stderr_text}"
+                    return ImplementerResult(
+                        success=False,
+                        output=stdout_text,
+                        error=error_msg,
+                    )
+
+            finally:
+                await reap_process(proc, read_tasks)
 
         except Exception as e:
             print(f"[Cursor CLI] Error: {e}", file=sys.stderr)
@@ -169,4 +177,4 @@ class CursorCLIImplementer(BaseImplementer):
             )
 
     async def is_available(self) -> bool:
-        return shutil.which(self.COMMAND) is not None
+        return await command_available(self.COMMAND)
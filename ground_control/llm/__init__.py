@@ -3,6 +3,7 @@
 from ground_control.llm.base import BaseLLMProvider, LLMResponse
 from ground_control.llm.anthropic import AnthropicProvider
 from ground_control.llm.openai import OpenAIProvider
+from ground_control.llm.cache import LLMCache
 
 PROVIDERS: dict[str, type[BaseLLMProvider]] = {
     "anthropic": AnthropicProvider,
@@ -19,6 +20,7 @@ def get_provider(name: str, **kwargs) -> BaseLLMProvider:
 __all__ = [
     "BaseLLMProvider",
     "LLMResponse",
+    "LLMCache",
     "AnthropicProvider",
     "OpenAIProvider",
     "get_provider",
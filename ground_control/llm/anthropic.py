@@ -2,25 +2,47 @@
 
 from __future__ import annotations
 
-import json
-import os
-
 from anthropic import AsyncAnthropic
 
-from ground_control.llm.base import BaseLLMProvider, LLMResponse
+from ground_control.env import get_api_keys
+from ground_control.llm.base import BaseLLMProvider, LLMResponse, json_loads
+from ground_control.llm.cache import LLMCache
+from ground_control.llm.http import get_shared_async_client
+from ground_control.llm.rate_limit import AsyncRateLimiter
 
 DEFAULT_MODEL = "claude-sonnet-4-20250514"
+API_VERSION = "2023-06-01"  # anthropic-version header for low-level requests
+JSON_INSTRUCTIONS = "You MUST respond with valid JSON only. No markdown fences, no extra text."
 
 
 class AnthropicProvider(BaseLLMProvider):
     """LLM provider backed by the Anthropic API."""
 
-    def __init__(self, api_key: str | None = None, default_model: str | None = None):
+    BASE_URL = "https://api.anthropic.com"
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        default_model: str | None = None,
+        cache: LLMCache | None = None,
+        rate_limiter: AsyncRateLimiter | None = None,
+        api_keys: list[str] | None = None,
+        low_level: bool = False,
+        **http_options,
+    ):
+        if not api_key and not api_keys:
+            api_keys = get_api_keys("anthropic")
         super().__init__(
-            api_key=api_key or os.environ.get("ANTHROPIC_API_KEY"),
+            api_key=api_key,
+            api_keys=api_keys,
+            low_level=low_level,
             default_model=default_model or DEFAULT_MODEL,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            **http_options,
         )
-        self._client = AsyncAnthropic(api_key=self.api_key)
+        self._http = get_shared_async_client(**self._http_options)
+        self._clients = [AsyncAnthropic(api_key=key, http_client=self._http) for key in self.api_keys]
 
     async def complete(
         self,
@@ -42,21 +64,44 @@ class AnthropicProvider(BaseLLMProvider):
         if system:
             kwargs["system"] = system
 
-        response = await self._client.messages.create(**kwargs)
+        return await self._send(kwargs, lambda: self._create(kwargs))
 
-        content = ""
-        for block in response.content:
-            if block.type == "text":
-                content += block.text
+    async def _create(self, kwargs: dict) -> LLMResponse:
+        if self.low_level:
+            return await self._create_low_level(kwargs)
+
+        # Streaming keeps the connection busy with small events instead of one
+        # long silent wait, and the text is assembled as it is decoded.
+        chunks: list[str] = []
+        async with self._next_client().messages.stream(**kwargs) as stream:
+            async for text in stream.text_stream:
+                chunks.append(text)
+            response = await stream.get_final_message()
 
         return LLMResponse(
-            content=content,
+            content="".join(chunks),
             model=response.model,
             usage={
                 "input_tokens": response.usage.input_tokens,
                 "output_tokens": response.usage.output_tokens,
             },
-            raw=response.model_dump(),
+            raw_response=response,
+        )
+
+    async def _create_low_level(self, kwargs: dict) -> LLMResponse:
+        data = await self._post(
+            "/v1/messages",
+            {"x-api-key": self._next_client().api_key, "anthropic-version": API_VERSION},
+            kwargs,
+        )
+        return LLMResponse(
+            content="".join(b["text"] for b in data["content"] if b["type"] == "text"),
+            model=data["model"],
+            usage={
+                "input_tokens": data["usage"]["input_tokens"],
+                "output_tokens": data["usage"]["output_tokens"],
+            },
+            raw_response=data,
         )
 
     async def complete_json(
@@ -68,14 +113,11 @@ class AnthropicProvider(BaseLLMProvider):
         max_tokens: int = 4096,
         system: str | None = None,
     ) -> dict:
-        json_system = (system or "") + (
-            "\n\nYou MUST respond with valid JSON only. No markdown fences, no extra text."
-        )
         response = await self.complete(
             messages,
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
-            system=json_system.strip(),
+            system=f"{system.lstrip()}\n\n{JSON_INSTRUCTIONS}" if system else JSON_INSTRUCTIONS,
         )
-        return json.loads(response.content)
+        return json_loads(response.content)
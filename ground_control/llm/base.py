@@ -3,7 +3,24 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import functools
+import json
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+import httpx
+
+from ground_control.llm.http import release_shared_async_client
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson ships with the "fast" extra
+    from json import loads as json_loads
+
+if TYPE_CHECKING:
+    from ground_control.llm.cache import LLMCache
+    from ground_control.llm.rate_limit import AsyncRateLimiter
 
 
 @dataclass
@@ -13,15 +30,64 @@ class LLMResponse:
     content: str
     model: str
     usage: dict[str, int] = field(default_factory=dict)
-    raw: dict | None = None
+    # The SDK's response object (or decoded JSON on the low-level path);
+    # serialized only if someone reads ``raw``.
+    raw_response: Any = field(default=None, repr=False, compare=False)
+
+    @functools.cached_property
+    def raw(self) -> dict | None:
+        """The provider's full response as a dict, dumped on first access."""
+        if self.raw_response is None or isinstance(self.raw_response, dict):
+            return self.raw_response
+        return self.raw_response.model_dump()
 
 
 class BaseLLMProvider(abc.ABC):
     """Interface that every LLM provider must implement."""
 
-    def __init__(self, api_key: str | None = None, default_model: str | None = None):
-        self.api_key = api_key
+    # Endpoint used to pre-open connections in warm_up(); set by subclasses.
+    BASE_URL: str | None = None
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        default_model: str | None = None,
+        cache: LLMCache | None = None,
+        rate_limiter: AsyncRateLimiter | None = None,
+        http_max_connections: int = 500,
+        http_max_keepalive: int = 200,
+        http_timeout: float = 120.0,
+        api_keys: list[str] | None = None,
+        low_level: bool = False,
+    ):
+        # Several keys spread calls over several accounts' rate limits;
+        # subclasses build one SDK client per key into self._clients.
+        self.api_keys = list(api_keys or [api_key])
+        self.api_key = self.api_keys[0]
         self.default_model = default_model
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        # Post requests with the shared httpx client instead of going through
+        # the SDK's validation and retry layers.
+        self.low_level = low_level
+        # The SDKs' default pools queue requests well below the concurrency a
+        # large run can generate, so providers use an explicitly sized one,
+        # shared across providers (see llm.http).
+        self._http_options = {
+            "limits": httpx.Limits(
+                max_connections=http_max_connections,
+                max_keepalive_connections=http_max_keepalive,
+            ),
+            "timeout": httpx.Timeout(http_timeout),
+        }
+        self._http: httpx.AsyncClient | None = None
+        self._clients: list[Any] = []
+        self._next_client_index = 0
+
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Cache hit/miss counters, or an empty dict when caching is off."""
+        return dict(self.cache.stats) if self.cache else {}
 
     @abc.abstractmethod
     async def complete(
@@ -52,6 +118,73 @@ class BaseLLMProvider(abc.ABC):
         """
         ...
 
+    async def warm_up(self, connections: int = 4) -> None:
+        """Open a few keep-alive connections to the API ahead of the first call.
+
+        Failures are ignored; the real request will surface any problem.
+        """
+        if self._http is None or not self.BASE_URL:
+            return
+        await asyncio.gather(
+            *(self._http.head(self.BASE_URL) for _ in range(connections)),
+            return_exceptions=True,
+        )
+
+    async def aclose(self) -> None:
+        """Release this provider's use of the shared HTTP connection pool.
+
+        The pool itself is closed once the last provider using it lets go.
+        """
+        if self._http is not None:
+            await release_shared_async_client(self._http)
+            self._http = None
+
+    async def _post(self, path: str, headers: dict[str, str], payload: dict) -> dict:
+        """POST ``payload`` to the API over the shared pool, bypassing the SDK.
+
+        No retries: an error status raises ``httpx.HTTPStatusError``.
+        """
+        response = await self._http.post(
+            self.BASE_URL + path,
+            headers={"content-type": "application/json", **headers},
+            content=json.dumps(payload),
+        )
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    async def _send(
+        self,
+        request: dict[str, Any],
+        fetch: Callable[[], Awaitable[LLMResponse]],
+    ) -> LLMResponse:
+        """Serve ``request`` from the cache, or call ``fetch`` within the rate limits."""
+        if self.rate_limiter is not None:
+            fetch = self._rate_limited(request, fetch)
+        if self.cache is None:
+            return await fetch()
+        return await self.cache.get_or_fetch({"provider": type(self).__name__, **request}, fetch)
+
+    def _rate_limited(
+        self,
+        request: dict[str, Any],
+        fetch: Callable[[], Awaitable[LLMResponse]],
+    ) -> Callable[[], Awaitable[LLMResponse]]:
+        async def limited() -> LLMResponse:
+            await self.rate_limiter.acquire(
+                self.rate_limiter.estimate_tokens(
+                    request["messages"], request.get("system"), request["max_tokens"]
+                )
+            )
+            return await fetch()
+
+        return limited
+
+    def _next_client(self) -> Any:
+        """Return the SDK client for the next call, rotating through the API keys."""
+        client = self._clients[self._next_client_index % len(self._clients)]
+        self._next_client_index += 1
+        return client
+
     def _resolve_model(self, model: str | None) -> str:
         if model:
             return model
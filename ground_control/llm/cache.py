@@ -0,0 +1,126 @@
+"""Content-addressed cache for LLM responses."""
+
+from __future__ import annotations
+
+import abc
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from ground_control.llm.base import LLMResponse
+
+
+class CacheBackend(abc.ABC):
+    """Storage for cached responses, keyed by request hash."""
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> dict | None:
+        """Return the stored entry for ``key``, or None if absent or expired."""
+        ...
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: dict) -> None:
+        """Store ``value`` under ``key``."""
+        ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache; entries live as long as the provider."""
+
+    def __init__(self, max_entries: int = 256, ttl: float | None = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    async def get(self, key: str) -> dict | None:
+        try:
+            stored_at, value = self._entries[key]
+        except KeyError:
+            return None
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: dict) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class FileCacheBackend(CacheBackend):
+    """One JSON file per entry in a directory, so hits survive across runs."""
+
+    def __init__(self, directory: str | Path, ttl: float | None = None):
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    async def get(self, key: str) -> dict | None:
+        path = self.directory / f"{key}.json"
+        try:
+            if self.ttl is not None and time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            with open(path, "rb") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    async def set(self, key: str, value: dict) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.directory, delete=False
+            ) as f:
+                json.dump(value, f)
+            os.replace(f.name, self.directory / f"{key}.json")
+        except OSError:
+            # Caching is best-effort; an unwritable directory just means misses.
+            pass
+
+
+class LLMCache:
+    """Reuses responses for identical requests.
+
+    Only requests at or below ``max_temperature`` are cached, since sampling
+    at higher temperatures is expected to vary between calls.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None, max_temperature: float = 0.2):
+        self.backend = backend or MemoryCacheBackend()
+        self.max_temperature = max_temperature
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def key(request: dict[str, Any]) -> str:
+        encoded = json.dumps(request, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    async def get_or_fetch(
+        self,
+        request: dict[str, Any],
+        fetch: Callable[[], Awaitable[LLMResponse]],
+    ) -> LLMResponse:
+        """Return the cached response for ``request``, calling ``fetch`` on a miss."""
+        if request.get("temperature", 0) > self.max_temperature:
+            return await fetch()
+
+        key = self.key(request)
+        entry = await self.backend.get(key)
+        if entry is not None:
+            self.stats["hits"] += 1
+            return LLMResponse(content=entry["content"], model=entry["model"], usage=entry["usage"])
+
+        self.stats["misses"] += 1
+        response = await fetch()
+        await self.backend.set(
+            key,
+            {"content": response.content, "model": response.model, "usage": response.usage},
+        )
+        return response
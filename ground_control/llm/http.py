@@ -0,0 +1,53 @@
+"""HTTP connection pools shared by the LLM providers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+# The SDKs require a client built on the httpx they were installed with;
+# both share it, so either SDK's default client class works for both.
+from anthropic import DefaultAsyncHttpxClient
+
+
+@dataclass
+class _Pool:
+    client: httpx.AsyncClient
+    users: int = 0
+
+
+# One pool per distinct set of client options, so a provider never silently
+# gets limits or timeouts it did not ask for.
+_pools: dict[str, _Pool] = {}
+
+
+def _pool_key(options: dict[str, Any]) -> str:
+    # httpx.Limits and httpx.Timeout are not hashable, but their reprs
+    # spell out every setting.
+    return repr(sorted(options.items()))
+
+
+def get_shared_async_client(**options: Any) -> httpx.AsyncClient:
+    """Return the process-wide client for ``options``, creating it if needed.
+
+    Every call counts as one user of the client; pair it with
+    ``release_shared_async_client()``.
+    """
+    key = _pool_key(options)
+    pool = _pools.get(key)
+    if pool is None or pool.client.is_closed:
+        pool = _pools[key] = _Pool(DefaultAsyncHttpxClient(**options))
+    pool.users += 1
+    return pool.client
+
+
+async def release_shared_async_client(client: httpx.AsyncClient) -> None:
+    """Drop one use of ``client``; the last user closes the pool."""
+    for key, pool in _pools.items():
+        if pool.client is client:
+            pool.users -= 1
+            if pool.users == 0:
+                del _pools[key]
+                await client.aclose()
+            return
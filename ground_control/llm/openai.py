@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
-import os
-
 from openai import AsyncOpenAI
 
-from ground_control.llm.base import BaseLLMProvider, LLMResponse
+from ground_control.env import get_api_keys
+from ground_control.llm.base import BaseLLMProvider, LLMResponse, json_loads
+from ground_control.llm.cache import LLMCache
+from ground_control.llm.http import get_shared_async_client
+from ground_control.llm.rate_limit import AsyncRateLimiter
 
 DEFAULT_MODEL = "gpt-4o"
 
@@ -15,12 +16,31 @@ DEFAULT_MODEL = "gpt-4o"
 class OpenAIProvider(BaseLLMProvider):
     """LLM provider backed by the OpenAI API."""
 
-    def __init__(self, api_key: str | None = None, default_model: str | None = None):
+    BASE_URL = "https://api.openai.com"
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        default_model: str | None = None,
+        cache: LLMCache | None = None,
+        rate_limiter: AsyncRateLimiter | None = None,
+        api_keys: list[str] | None = None,
+        low_level: bool = False,
+        **http_options,
+    ):
+        if not api_key and not api_keys:
+            api_keys = get_api_keys("openai")
         super().__init__(
-            api_key=api_key or os.environ.get("OPENAI_API_KEY"),
+            api_key=api_key,
+            api_keys=api_keys,
+            low_level=low_level,
             default_model=default_model or DEFAULT_MODEL,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            **http_options,
         )
-        self._client = AsyncOpenAI(api_key=self.api_key)
+        self._http = get_shared_async_client(**self._http_options)
+        self._clients = [AsyncOpenAI(api_key=key, http_client=self._http) for key in self.api_keys]
 
     async def complete(
         self,
@@ -37,22 +57,81 @@ class OpenAIProvider(BaseLLMProvider):
         if system:
             full_messages.insert(0, {"role": "system", "content": system})
 
-        response = await self._client.chat.completions.create(
-            model=resolved_model,
-            messages=full_messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
+        kwargs: dict = {
+            "model": resolved_model,
+            "messages": full_messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        return await self._send(kwargs, lambda: self._create(kwargs))
+
+    async def _create(self, kwargs: dict) -> LLMResponse:
+        if self.low_level:
+            return await self._create_low_level(kwargs)
+
+        # Streamed so the text is assembled as it is decoded; usage arrives
+        # in a final chunk with no choices.
+        stream = await self._next_client().chat.completions.create(
+            **kwargs, stream=True, stream_options={"include_usage": True}
+        )
+        chunks: list[str] = []
+        response_id = None
+        created = None
+        response_model = kwargs["model"]
+        finish_reason = None
+        usage = None
+        async for chunk in stream:
+            response_id = chunk.id or response_id
+            created = chunk.created or created
+            response_model = chunk.model or response_model
+            if chunk.usage is not None:
+                usage = chunk.usage
+            if chunk.choices:
+                choice = chunk.choices[0]
+                finish_reason = choice.finish_reason or finish_reason
+                if choice.delta.content:
+                    chunks.append(choice.delta.content)
+
+        content = "".join(chunks)
+        # Same shape as a non-streamed chat.completion, so ``raw`` matches
+        # the low-level path.
+        raw = {
+            "id": response_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": response_model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": finish_reason,
+            }],
+            "usage": usage.model_dump() if usage else None,
+        }
+        return LLMResponse(
+            content=content,
+            model=response_model,
+            usage={
+                "prompt_tokens": usage.prompt_tokens if usage else 0,
+                "completion_tokens": usage.completion_tokens if usage else 0,
+            },
+            raw_response=raw,
         )
 
-        choice = response.choices[0]
+    async def _create_low_level(self, kwargs: dict) -> LLMResponse:
+        data = await self._post(
+            "/v1/chat/completions",
+            {"authorization": f"Bearer {self._next_client().api_key}"},
+            kwargs,
+        )
+        usage = data.get("usage") or {}
         return LLMResponse(
-            content=choice.message.content or "",
-            model=response.model,
+            content=data["choices"][0]["message"]["content"] or "",
+            model=data["model"],
             usage={
-                "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-                "completion_tokens": response.usage.completion_tokens if response.usage else 0,
+                "prompt_tokens": usage.get("prompt_tokens", 0),
+                "completion_tokens": usage.get("completion_tokens", 0),
             },
-            raw=response.model_dump(),
+            raw_response=data,
         )
 
     async def complete_json(
@@ -70,13 +149,14 @@ class OpenAIProvider(BaseLLMProvider):
         if system:
             full_messages.insert(0, {"role": "system", "content": system})
 
-        response = await self._client.chat.completions.create(
-            model=resolved_model,
-            messages=full_messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            response_format={"type": "json_object"},
-        )
-
-        content = response.choices[0].message.content or "{}"
-        return json.loads(content)
+        kwargs: dict = {
+            "model": resolved_model,
+            "messages": full_messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response_format": {"type": "json_object"},
+        }
+        response = await self._send(kwargs, lambda: self._create(kwargs))
+
+        content = response.content or "{}"
+        return json_loads(content)
@@ -0,0 +1,60 @@
+"""Client-side request and token budgets for LLM calls."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+
+class AsyncRateLimiter:
+    """Token-bucket limiter over requests per minute and tokens per minute.
+
+    Buckets start full and refill continuously; callers wait until both have
+    room, so bursts up to the per-minute budget go out immediately and
+    sustained load settles at the provider's limits instead of hitting 429s.
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, rpm: int | None = None, tpm: int | None = None):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm or 0)
+        self._tokens = float(tpm or 0)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def estimate_tokens(messages: list[dict], system: str | None, max_tokens: int) -> int:
+        """Rough request size: ~4 characters per input token plus the output cap."""
+        chars = len(json.dumps(messages)) + len(system or "")
+        return chars // 4 + max_tokens
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request of ``tokens`` tokens fits in the budget, then spend it."""
+        if self.tpm:
+            # A single request larger than the whole budget would never fit.
+            tokens = min(tokens, self.tpm)
+        async with self._lock:
+            while (delay := self._delay(tokens)) > 0:
+                await asyncio.sleep(delay)
+            if self.rpm:
+                self._requests -= 1
+            if self.tpm:
+                self._tokens -= tokens
+
+    def _delay(self, tokens: int) -> float:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+
+        delay = 0.0
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+            if self._requests < 1:
+                delay = (1 - self._requests) * 60 / self.rpm
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+            if self._tokens < tokens:
+                delay = max(delay, (tokens - self._tokens) * 60 / self.tpm)
+        return delay
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from pathlib import Path
+from typing import Awaitable, TypeVar
 
 from rich.console import Console
 from rich.panel import Panel
@@ -14,6 +16,8 @@ from ground_control.implementers import get_implementer
 from ground_control.implementers.base import BaseImplementer
 from ground_control.llm import get_provider
 from ground_control.llm.base import BaseLLMProvider
+from ground_control.llm.cache import FileCacheBackend, LLMCache
+from ground_control.llm.rate_limit import AsyncRateLimiter
 from ground_control.planner import Planner, PlannedTask
 from ground_control.state import StateStore, RunStatus, TaskStatus
 from ground_control.task_queue import TaskQueue, TaskResult
@@ -22,6 +26,8 @@ from ground_control.ticket_sources.base import Ticket, TicketStatus
 
 console = Console()
 
+T = TypeVar("T")
+
 
 class Orchestrator:
     """Central engine that coordinates planning, agents, and execution."""
@@ -38,6 +44,8 @@ class Orchestrator:
         self.state = state
         self.llm = llm
         self._implementers: dict[str, BaseImplementer] = {}
+        self._warm_up: asyncio.Task | None = None
+        self._prompt_project_suffix = self._build_project_suffix()
 
     @classmethod
     async def from_project_name(cls, project_name: str) -> "Orchestrator":
@@ -54,9 +62,21 @@ class Orchestrator:
         await state.initialize()
 
         # Use project-level LLM settings
+        cache = None
+        if project_config.settings.llm_cache:
+            cache = LLMCache(FileCacheBackend(base / ".cache" / "llm"))
+        rate_limiter = None
+        if project_config.settings.llm_rpm or project_config.settings.llm_tpm:
+            rate_limiter = AsyncRateLimiter(
+                rpm=project_config.settings.llm_rpm,
+                tpm=project_config.settings.llm_tpm,
+            )
         llm = get_provider(
             project_config.settings.llm_provider,
-            default_model=project_config.settings.llm_model
+            default_model=project_config.settings.llm_model,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            low_level=project_config.settings.llm_low_level,
         )
 
         return cls(
@@ -85,20 +105,30 @@ class Orchestrator:
             config_snapshot=config.model_dump(),
         )
 
+        # Open API connections in the background, ready for planning. Never
+        # awaited: planning need not wait on it, and cleanup() cancels it.
+        self._warm_up = asyncio.create_task(self.llm.warm_up())
+
         # Phase 1: Load tickets
         console.print("\n[bold yellow]Phase 1:[/] Loading tickets...")
-        await self.state.update_run_status(run_id, RunStatus.PLANNING)
-
         ticket_source = get_ticket_source(
             config.ticket_source.type,
             path=config.ticket_source.path,
         )
-        tickets = await ticket_source.load_tickets()
+        load_tickets = asyncio.create_task(ticket_source.load_tickets())
+        try:
+            await self.state.update_run_status(run_id, RunStatus.PLANNING)
+        except BaseException:
+            load_tickets.cancel()
+            await asyncio.gather(load_tickets, return_exceptions=True)
+            raise
+        tickets = await self._run_phase(run_id, "Ticket loading", load_tickets)
 
         open_tickets = [t for t in tickets if t.status == TicketStatus.OPEN]
         console.print(f"  Found {len(tickets)} tickets ({len(open_tickets)} open)")
 
         if not open_tickets:
+            self._warm_up.cancel()
             console.print("[yellow]No open tickets to process.[/]")
             await self.state.update_run_status(run_id, RunStatus.COMPLETED)
             return run_id
@@ -111,20 +141,24 @@ class Orchestrator:
         ]
 
         planner = Planner(self.llm, config)
-        planned_tasks = await planner.plan(open_tickets, agents)
+        planned_tasks = await self._run_phase(
+            run_id, "Planning", planner.plan(open_tickets, agents)
+        )
         console.print(f"  Planned {len(planned_tasks)} tasks")
 
-        for pt in planned_tasks:
-            await self.state.create_task(
-                task_id=pt.id,
-                run_id=run_id,
-                title=pt.title,
-                description=pt.description,
-                ticket_id=pt.ticket_id,
-                assigned_agent=pt.assigned_agent,
-                priority=pt.priority,
-                dependencies=pt.dependencies,
-            )
+        await self.state.create_tasks_bulk([
+            {
+                "task_id": pt.id,
+                "run_id": run_id,
+                "title": pt.title,
+                "description": pt.description,
+                "ticket_id": pt.ticket_id,
+                "assigned_agent": pt.assigned_agent,
+                "priority": pt.priority,
+                "dependencies": pt.dependencies,
+            }
+            for pt in planned_tasks
+        ])
 
         # Phase 3: Execute
         console.print(f"\n[bold yellow]Phase 3:[/] Executing tasks (max parallel: {config.settings.max_parallel_agents})...")
@@ -163,7 +197,7 @@ class Orchestrator:
         config = self.project_config
 
         # Reset interrupted and optionally failed tasks back to pending
-        all_tasks = await self.state.list_tasks(run_id)
+        all_tasks = await self.state.list_task_states(run_id)
         reset_count = 0
         for task in all_tasks:
             if task["status"] in (TaskStatus.RUNNING.value, TaskStatus.QUEUED.value):
@@ -214,7 +248,7 @@ class Orchestrator:
         new_failed = sum(1 for r in results if not r.success)
 
         # Check final state including previously completed tasks
-        all_tasks_final = await self.state.list_tasks(run_id)
+        all_tasks_final = await self.state.list_task_states(run_id)
         total_failed = sum(1 for t in all_tasks_final if t["status"] == TaskStatus.FAILED.value)
 
         final_status = RunStatus.COMPLETED if total_failed == 0 else RunStatus.FAILED
@@ -229,6 +263,18 @@ class Orchestrator:
 
         return run_id
 
+    async def _run_phase(self, run_id: str, name: str, aw: Awaitable[T]) -> T:
+        """Await one phase of a run within the project's ``phase_timeout``.
+
+        On timeout the phase is cancelled and the run is marked failed.
+        """
+        timeout = self.project_config.settings.phase_timeout
+        try:
+            return await asyncio.wait_for(aw, timeout)
+        except asyncio.TimeoutError:
+            await self.state.update_run_status(run_id, RunStatus.FAILED)
+            raise TimeoutError(f"{name} timed out after {timeout:g}s") from None
+
     async def _execute_task(self, task: dict) -> TaskResult:
         """Execute a single task using the assigned agent and implementer."""
         task_id = task["id"]
@@ -256,7 +302,7 @@ class Orchestrator:
 
         prompt = self._build_prompt(task, agent_def)
 
-        await self.state.add_log(
+        self.state.queue_log(
             task_id=task_id,
             message=f"Starting execution with agent '{agent_name}' via '{implementer_name}'",
             agent_name=agent_name,
@@ -281,7 +327,7 @@ class Orchestrator:
                 error=result.error,
             )
 
-            await self.state.add_log(
+            self.state.queue_log(
                 task_id=task_id,
                 message=f"Execution {'completed' if result.success else 'failed'}",
                 level="info" if result.success else "error",
@@ -302,7 +348,7 @@ class Orchestrator:
                 status="failed",
                 error=error_msg,
             )
-            await self.state.add_log(
+            self.state.queue_log(
                 task_id=task_id,
                 message=f"Execution error: {error_msg}",
                 level="error",
@@ -312,22 +358,23 @@ class Orchestrator:
 
     def _build_prompt(self, task: dict, agent_def: AgentDefinition) -> str:
         """Build the full prompt for the implementer, combining agent system prompt and task details."""
+        return (
+            f"{agent_def.system_prompt}\n\n---\n\n## Task: {task['title']}\n\n"
+            f"{task.get('description', '')}\n{self._prompt_project_suffix}"
+        )
+
+    def _build_project_suffix(self) -> str:
+        """Project details appended to every task prompt; they don't change within a run."""
+        structure = self.project_config.structure
         parts = [
-            agent_def.system_prompt,
-            "",
-            "---",
-            "",
-            f"## Task: {task['title']}",
-            "",
-            task.get("description", ""),
             "",
             f"**Project path:** {self.project_config.repo_path}",
-            f"**Language:** {self.project_config.structure.language}",
+            f"**Language:** {structure.language}",
         ]
-        if self.project_config.structure.framework:
-            parts.append(f"**Framework:** {self.project_config.structure.framework}")
-        if self.project_config.structure.test_runner:
-            parts.append(f"**Test runner:** {self.project_config.structure.test_runner}")
+        if structure.framework:
+            parts.append(f"**Framework:** {structure.framework}")
+        if structure.test_runner:
+            parts.append(f"**Test runner:** {structure.test_runner}")
 
         return "\n".join(parts)
 
@@ -338,4 +385,8 @@ class Orchestrator:
 
     async def cleanup(self) -> None:
         """Close resources."""
+        if self._warm_up is not None:
+            self._warm_up.cancel()
+            await asyncio.gather(self._warm_up, return_exceptions=True)
+        await self.llm.aclose()
         await self.state.close()
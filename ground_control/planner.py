@@ -6,11 +6,19 @@ import json
 import uuid
 from dataclasses import dataclass, field
 
+from rich.console import Console
+
 from ground_control.agent_manager import AgentDefinition
 from ground_control.config import ProjectConfig
 from ground_control.llm.base import BaseLLMProvider
 from ground_control.ticket_sources.base import Ticket
 
+console = Console()
+
+# Per-ticket limits applied when the planning prompt is over budget.
+TRUNCATED_DESCRIPTION_CHARS = 512
+TRUNCATED_CRITERIA = 3
+
 
 @dataclass
 class PlannedTask:
@@ -85,6 +93,19 @@ class Planner:
 
         agents_desc = self._format_agents(agents)
         tickets_json = self._format_tickets(tickets)
+        # ~4 characters per token; long prompts cost more and answer slower.
+        budget = self.config.settings.max_planning_input_tokens
+        if len(tickets_json) // 4 > budget:
+            tickets_json = self._format_tickets(tickets, truncate=True)
+            truncated = sum(
+                1 for t in tickets
+                if len(t.description) > TRUNCATED_DESCRIPTION_CHARS
+                or len(t.acceptance_criteria) > TRUNCATED_CRITERIA
+            )
+            console.print(
+                f"  [yellow]Planning input over {budget} tokens; "
+                f"truncated {truncated} ticket(s)[/]"
+            )
 
         system = PLANNING_SYSTEM_PROMPT.format(
             agents_description=agents_desc,
@@ -111,18 +132,29 @@ class Planner:
             lines.append(f"- {a.name} ({a.role}): capabilities=[{caps}]")
         return "\n".join(lines)
 
-    def _format_tickets(self, tickets: list[Ticket]) -> str:
-        items = []
-        for t in tickets:
-            items.append({
-                "id": t.id,
-                "title": t.title,
-                "description": t.description,
-                "priority": t.priority.value,
-                "acceptance_criteria": t.acceptance_criteria,
-                "dependencies": t.dependencies,
-            })
-        return json.dumps(items, indent=2)
+    def _format_tickets(self, tickets: list[Ticket], truncate: bool = False) -> str:
+        # Compact separators: indentation only costs encode time and prompt tokens.
+        return json.dumps(
+            [
+                {
+                    "id": t.id,
+                    "title": t.title,
+                    "description": (
+                        _truncate(t.description, TRUNCATED_DESCRIPTION_CHARS)
+                        if truncate else t.description
+                    ),
+                    "priority": t.priority.value,
+                    "acceptance_criteria": (
+                        t.acceptance_criteria[:TRUNCATED_CRITERIA]
+                        if truncate else t.acceptance_criteria
+                    ),
+                    "dependencies": t.dependencies,
+                }
+                for t in tickets
+            ],
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
 
     def _parse_plan(self, data: dict, tickets: list[Ticket]) -> list[PlannedTask]:
         raw_tasks = data.get("tasks", [])
@@ -161,3 +193,9 @@ class Planner:
             ))
 
         return planned
+
+
+def _truncate(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "...[truncated]"
@@ -2,20 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
+import time
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
+from typing import AsyncIterator
 
 import aiosqlite
 
+_PRAGMAS = """
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -64000;
+PRAGMA busy_timeout = 5000;
+"""
+
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS runs (
     id TEXT PRIMARY KEY,
     project_name TEXT NOT NULL,
     status TEXT NOT NULL DEFAULT 'pending',
-    created_at TEXT NOT NULL,
-    updated_at TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL,
     config_snapshot TEXT
 );
 
@@ -30,8 +41,8 @@ CREATE TABLE IF NOT EXISTS tasks (
     priority INTEGER NOT NULL DEFAULT 0,
     dependencies TEXT NOT NULL DEFAULT '[]',
     result TEXT,
-    created_at TEXT NOT NULL,
-    updated_at TEXT NOT NULL
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
 );
 
 CREATE TABLE IF NOT EXISTS task_logs (
@@ -41,7 +52,7 @@ CREATE TABLE IF NOT EXISTS task_logs (
     level TEXT NOT NULL DEFAULT 'info',
     message TEXT NOT NULL,
     metadata TEXT,
-    created_at TEXT NOT NULL
+    created_at INTEGER NOT NULL
 );
 
 CREATE TABLE IF NOT EXISTS agent_executions (
@@ -55,16 +66,33 @@ CREATE TABLE IF NOT EXISTS agent_executions (
     output TEXT,
     error TEXT,
     tokens_used TEXT,
-    started_at TEXT,
-    finished_at TEXT
+    started_at INTEGER,
+    finished_at INTEGER
 );
 
-CREATE INDEX IF NOT EXISTS idx_tasks_run_id ON tasks(run_id);
+-- Serves list_tasks' WHERE run_id = ? ORDER BY priority DESC, created_at
+-- straight from the index; it supersedes the old run_id-only index.
+DROP INDEX IF EXISTS idx_tasks_run_id;
+CREATE INDEX IF NOT EXISTS idx_tasks_run_priority ON tasks(run_id, priority DESC, created_at);
 CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
 CREATE INDEX IF NOT EXISTS idx_task_logs_task_id ON task_logs(task_id);
 CREATE INDEX IF NOT EXISTS idx_agent_executions_run_id ON agent_executions(run_id);
 """
 
+# Bumped whenever _SCHEMA changes; stored in PRAGMA user_version. A database
+# already at this version has the full schema and skips the DDL on open.
+_SCHEMA_VERSION = 1
+
+# Timestamp columns per table. Version 0 stored them as ISO 8601 TEXT.
+_TIMESTAMP_COLUMNS = {
+    "runs": ("created_at", "updated_at"),
+    "tasks": ("created_at", "updated_at"),
+    "task_logs": ("created_at",),
+    "agent_executions": ("started_at", "finished_at"),
+}
+
+_TASK_STATE_COLUMNS = "id, status, priority, dependencies"
+
 
 class RunStatus(str, Enum):
     PENDING = "pending"
@@ -83,25 +111,105 @@ class TaskStatus(str, Enum):
     SKIPPED = "skipped"
 
 
-def _now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def _now() -> int:
+    return time.time_ns() // 1_000_000
+
+
+def iso(ts: int | None) -> str | None:
+    """Render a stored timestamp (UNIX epoch milliseconds) as an ISO 8601 string."""
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts / 1000, timezone.utc).isoformat()
+
+
+def _load_dependencies(text: str) -> list[str]:
+    # Most tasks have no dependencies; skip the JSON decoder for those.
+    return [] if text == "[]" else json.loads(text)
 
 
 class StateStore:
     """Async SQLite state store for ground-control."""
 
-    def __init__(self, db_path: str | Path = "ground_control.db"):
+    # Queued log lines are written together this long after the first one.
+    LOG_FLUSH_INTERVAL = 0.05
+
+    def __init__(self, db_path: str | Path = "ground_control.db", uri: bool = False):
+        """``uri=True`` treats ``db_path`` as an SQLite ``file:`` URI."""
         self.db_path = str(db_path)
+        self.uri = uri
         self._db: aiosqlite.Connection | None = None
+        # Serializes writers, so one mutator's rollback never discards
+        # another's uncommitted statements on the shared connection.
+        self._write_lock = asyncio.Lock()
+        # list_tasks results per run, dropped on any task write. The
+        # generation counter keeps a SELECT that raced a write from caching.
+        self._tasks_cache: dict[str, list[dict]] = {}
+        self._tasks_generation = 0
+        self._log_buffer: list[tuple] = []
+        self._log_flusher: asyncio.Task | None = None
 
     async def initialize(self) -> None:
-        self._db = await aiosqlite.connect(self.db_path)
+        self._db = await aiosqlite.connect(self.db_path, uri=self.uri)
         self._db.row_factory = aiosqlite.Row
-        await self._db.executescript(_SCHEMA)
+        # WAL lets readers proceed during writes, and with synchronous=NORMAL
+        # a commit no longer waits on an fsync of the main database file.
+        if self.db_path != ":memory:":
+            await self._db.execute("PRAGMA journal_mode=WAL")
+        async with self._db.execute("PRAGMA user_version") as cursor:
+            (version,) = await cursor.fetchone()
+        if version >= _SCHEMA_VERSION:
+            await self._db.executescript(_PRAGMAS)
+            return
+        if version < 1:
+            await self._migrate_timestamps()
+        await self._db.executescript(_PRAGMAS + _SCHEMA)
+        await self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
         await self._db.commit()
 
+    async def _migrate_timestamps(self) -> None:
+        """Rebuild tables from before timestamps were epoch milliseconds.
+
+        The old columns have TEXT affinity, which would store integers as
+        text, so each table is recreated from _SCHEMA and its rows copied
+        over with the ISO strings converted.
+        """
+        async with self._db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'runs'"
+        ) as cursor:
+            if await cursor.fetchone() is None:
+                return  # fresh database
+        async with self._db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        ) as cursor:
+            indexes = [row[0] for row in await cursor.fetchall()]
+
+        script = ["PRAGMA legacy_alter_table = ON;", "BEGIN;"]
+        script += [f"DROP INDEX {name};" for name in indexes]
+        copies = []
+        for table, timestamps in _TIMESTAMP_COLUMNS.items():
+            async with self._db.execute(f"PRAGMA table_info({table})") as cursor:
+                columns = [row[1] for row in await cursor.fetchall()]
+            if not columns:
+                continue
+            select = ", ".join(
+                f"CAST(ROUND((julianday({col}) - 2440587.5) * 86400000) AS INTEGER)"
+                if col in timestamps else col
+                for col in columns
+            )
+            script.append(f"ALTER TABLE {table} RENAME TO {table}_v0;")
+            copies.append(
+                f"INSERT INTO {table} ({', '.join(columns)}) SELECT {select} FROM {table}_v0;"
+                f"DROP TABLE {table}_v0;"
+            )
+        script += [_SCHEMA, *copies, "COMMIT;", "PRAGMA legacy_alter_table = OFF;"]
+        await self._db.executescript("\n".join(script))
+
     async def close(self) -> None:
+        if self._log_flusher is not None:
+            await self._log_flusher
+        await self.flush_logs()
         if self._db:
+            await self._db.execute("PRAGMA optimize")
             await self._db.close()
             self._db = None
 
@@ -111,6 +219,21 @@ class StateStore:
             raise RuntimeError("StateStore not initialized. Call initialize() first.")
         return self._db
 
+    @contextlib.asynccontextmanager
+    async def _writing(self) -> AsyncIterator[None]:
+        """Run one mutator's statements under the write lock and commit them."""
+        async with self._write_lock:
+            try:
+                yield
+            except BaseException:
+                await self.db.rollback()
+                raise
+            await self.db.commit()
+
+    def _invalidate_tasks(self) -> None:
+        self._tasks_cache.clear()
+        self._tasks_generation += 1
+
     # ── Runs ──────────────────────────────────────────────────────────
 
     async def create_run(
@@ -118,12 +241,13 @@ class StateStore:
     ) -> dict:
         now = _now()
         config_json = json.dumps(config_snapshot) if config_snapshot else None
-        await self.db.execute(
-            "INSERT INTO runs (id, project_name, status, created_at, updated_at, config_snapshot) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (run_id, project_name, RunStatus.PENDING.value, now, now, config_json),
-        )
-        await self.db.commit()
+        async with self._writing():
+            await self.db.execute(
+                "INSERT INTO runs "
+                "(id, project_name, status, created_at, updated_at, config_snapshot) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (run_id, project_name, RunStatus.PENDING.value, now, now, config_json),
+            )
         return {
             "id": run_id,
             "project_name": project_name,
@@ -132,11 +256,11 @@ class StateStore:
         }
 
     async def update_run_status(self, run_id: str, status: RunStatus) -> None:
-        await self.db.execute(
-            "UPDATE runs SET status = ?, updated_at = ? WHERE id = ?",
-            (status.value, _now(), run_id),
-        )
-        await self.db.commit()
+        async with self._writing():
+            await self.db.execute(
+                "UPDATE runs SET status = ?, updated_at = ? WHERE id = ?",
+                (status.value, _now(), run_id),
+            )
 
     async def get_run(self, run_id: str) -> dict | None:
         async with self.db.execute("SELECT * FROM runs WHERE id = ?", (run_id,)) as cursor:
@@ -169,54 +293,140 @@ class StateStore:
     ) -> dict:
         now = _now()
         deps_json = json.dumps(dependencies or [])
-        await self.db.execute(
-            "INSERT INTO tasks "
-            "(id, run_id, ticket_id, title, description, assigned_agent, status, priority, "
-            "dependencies, created_at, updated_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                task_id, run_id, ticket_id, title, description,
-                assigned_agent, TaskStatus.PENDING.value, priority,
-                deps_json, now, now,
-            ),
-        )
-        await self.db.commit()
+        async with self._writing():
+            await self.db.execute(
+                "INSERT INTO tasks "
+                "(id, run_id, ticket_id, title, description, assigned_agent, status, priority, "
+                "dependencies, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    task_id, run_id, ticket_id, title, description,
+                    assigned_agent, TaskStatus.PENDING.value, priority,
+                    deps_json, now, now,
+                ),
+            )
+            self._invalidate_tasks()
         return {"id": task_id, "run_id": run_id, "title": title, "status": TaskStatus.PENDING.value}
 
-    async def update_task_status(self, task_id: str, status: TaskStatus, result: str | None = None) -> None:
-        if result is not None:
-            await self.db.execute(
-                "UPDATE tasks SET status = ?, result = ?, updated_at = ? WHERE id = ?",
-                (status.value, result, _now(), task_id),
+    async def create_tasks_bulk(self, tasks: list[dict]) -> None:
+        """Insert several tasks in one transaction.
+
+        Each dict takes the same keys as :meth:`create_task`.
+        """
+        now = _now()
+        async with self._writing():
+            await self.db.executemany(
+                "INSERT INTO tasks "
+                "(id, run_id, ticket_id, title, description, assigned_agent, status, priority, "
+                "dependencies, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        t["task_id"], t["run_id"], t.get("ticket_id"), t["title"],
+                        t.get("description", ""), t.get("assigned_agent"),
+                        TaskStatus.PENDING.value, t.get("priority", 0),
+                        json.dumps(t.get("dependencies") or []), now, now,
+                    )
+                    for t in tasks
+                ],
             )
-        else:
-            await self.db.execute(
+            self._invalidate_tasks()
+
+    async def update_task_status(self, task_id: str, status: TaskStatus, result: str | None = None) -> None:
+        async with self._writing():
+            if result is not None:
+                await self.db.execute(
+                    "UPDATE tasks SET status = ?, result = ?, updated_at = ? WHERE id = ?",
+                    (status.value, result, _now(), task_id),
+                )
+            else:
+                await self.db.execute(
+                    "UPDATE tasks SET status = ?, updated_at = ? WHERE id = ?",
+                    (status.value, _now(), task_id),
+                )
+            self._invalidate_tasks()
+
+    async def update_tasks_status(self, task_ids: list[str], status: TaskStatus) -> None:
+        """Set the same status on several tasks with one statement and one commit."""
+        if not task_ids:
+            return
+        now = _now()
+        async with self._writing():
+            await self.db.executemany(
                 "UPDATE tasks SET status = ?, updated_at = ? WHERE id = ?",
-                (status.value, _now(), task_id),
+                [(status.value, now, task_id) for task_id in task_ids],
             )
-        await self.db.commit()
-
-    async def get_task(self, task_id: str) -> dict | None:
+            self._invalidate_tasks()
+
+    @staticmethod
+    def parse_dependencies(task: dict) -> list[str]:
+        """Return a task's dependency IDs, decoding the stored JSON if needed."""
+        dependencies = task["dependencies"]
+        if isinstance(dependencies, list):
+            return dependencies
+        return _load_dependencies(dependencies)
+
+    async def get_task(self, task_id: str, parse_json: bool = False) -> dict | None:
+        """Get a task by ID.
+
+        ``dependencies`` is left as its JSON text unless ``parse_json`` is set;
+        see parse_dependencies().
+        """
         async with self.db.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)) as cursor:
             row = await cursor.fetchone()
             if row:
                 d = dict(row)
-                d["dependencies"] = json.loads(d["dependencies"])
+                if parse_json:
+                    d["dependencies"] = _load_dependencies(d["dependencies"])
                 return d
             return None
 
-    async def list_tasks(self, run_id: str) -> list[dict]:
+    async def list_tasks(self, run_id: str, parse_json: bool = False) -> list[dict]:
+        """List a run's tasks, served from memory until a task is written.
+
+        The task dicts are shared between callers and must not be mutated.
+        ``dependencies`` is left as its JSON text unless ``parse_json`` is set,
+        in which case each task is copied with the list decoded.
+        """
+        cached = self._tasks_cache.get(run_id)
+        if cached is None:
+            cached = await self._fetch_tasks(run_id)
+        if parse_json:
+            return [{**t, "dependencies": _load_dependencies(t["dependencies"])} for t in cached]
+        return list(cached)
+
+    async def _fetch_tasks(self, run_id: str) -> list[dict]:
+        generation = self._tasks_generation
         async with self.db.execute(
             "SELECT * FROM tasks WHERE run_id = ? ORDER BY priority DESC, created_at",
             (run_id,),
         ) as cursor:
-            rows = await cursor.fetchall()
-            result = []
-            for r in rows:
-                d = dict(r)
-                d["dependencies"] = json.loads(d["dependencies"])
-                result.append(d)
-            return result
+            result = [dict(r) for r in await cursor.fetchall()]
+        if generation == self._tasks_generation:
+            self._tasks_cache[run_id] = result
+        return result
+
+    async def list_task_states(self, run_id: str) -> list[dict]:
+        """List a run's tasks with only id, status, priority and dependencies.
+
+        For bookkeeping that doesn't need the (potentially large) text columns.
+        """
+        async with self.db.execute(
+            f"SELECT {_TASK_STATE_COLUMNS} FROM tasks WHERE run_id = ? "
+            "ORDER BY priority DESC, created_at",
+            (run_id,),
+        ) as cursor:
+            # Plain tuples: no Row object or column-name lookup per row.
+            cursor.row_factory = None
+            return [
+                {
+                    "id": task_id,
+                    "status": status,
+                    "priority": priority,
+                    "dependencies": _load_dependencies(dependencies),
+                }
+                for task_id, status, priority, dependencies in await cursor.fetchall()
+            ]
 
     async def get_pending_tasks(self, run_id: str) -> list[dict]:
         """Get tasks that are ready to run (pending with all dependencies completed)."""
@@ -227,9 +437,9 @@ class StateStore:
         for task in all_tasks:
             if task["status"] != TaskStatus.PENDING.value:
                 continue
-            deps = task["dependencies"]
+            deps = _load_dependencies(task["dependencies"])
             if all(dep in completed_ids for dep in deps):
-                ready.append(task)
+                ready.append({**task, "dependencies": deps})
         return ready
 
     # ── Task Logs ─────────────────────────────────────────────────────
@@ -243,14 +453,70 @@ class StateStore:
         metadata: dict | None = None,
     ) -> None:
         meta_json = json.dumps(metadata) if metadata else None
-        await self.db.execute(
-            "INSERT INTO task_logs (task_id, agent_name, level, message, metadata, created_at) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (task_id, agent_name, level, message, meta_json, _now()),
-        )
-        await self.db.commit()
+        async with self._writing():
+            await self.db.execute(
+                "INSERT INTO task_logs (task_id, agent_name, level, message, metadata, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (task_id, agent_name, level, message, meta_json, _now()),
+            )
+
+    async def add_logs_bulk(self, logs: list[dict]) -> None:
+        """Insert several log lines in one transaction.
+
+        Each dict takes the same keys as :meth:`add_log`.
+        """
+        now = _now()
+        async with self._writing():
+            await self.db.executemany(
+                "INSERT INTO task_logs (task_id, agent_name, level, message, metadata, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        log["task_id"], log.get("agent_name"), log.get("level", "info"),
+                        log["message"],
+                        json.dumps(log["metadata"]) if log.get("metadata") else None, now,
+                    )
+                    for log in logs
+                ],
+            )
+
+    def queue_log(
+        self,
+        task_id: str,
+        message: str,
+        level: str = "info",
+        agent_name: str | None = None,
+        metadata: dict | None = None,
+    ) -> None:
+        """Buffer a log line without waiting for the database.
+
+        Buffered lines are inserted in one transaction shortly afterwards, or
+        on the next :meth:`flush_logs`, :meth:`get_logs` or :meth:`close`.
+        """
+        meta_json = json.dumps(metadata) if metadata else None
+        self._log_buffer.append((task_id, agent_name, level, message, meta_json, _now()))
+        if self._log_flusher is None:
+            self._log_flusher = asyncio.create_task(self._flush_logs_later())
+
+    async def _flush_logs_later(self) -> None:
+        await asyncio.sleep(self.LOG_FLUSH_INTERVAL)
+        self._log_flusher = None
+        await self.flush_logs()
+
+    async def flush_logs(self) -> None:
+        """Write all buffered log lines."""
+        if not self._log_buffer:
+            return
+        rows, self._log_buffer = self._log_buffer, []
+        async with self._writing():
+            await self.db.executemany(
+                "INSERT INTO task_logs (task_id, agent_name, level, message, metadata, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
 
     async def get_logs(self, task_id: str) -> list[dict]:
+        await self.flush_logs()
         async with self.db.execute(
             "SELECT * FROM task_logs WHERE task_id = ? ORDER BY created_at", (task_id,)
         ) as cursor:
@@ -274,13 +540,13 @@ class StateStore:
         input_prompt: str | None = None,
     ) -> int:
         now = _now()
-        cursor = await self.db.execute(
-            "INSERT INTO agent_executions "
-            "(task_id, run_id, agent_name, implementer, status, input_prompt, started_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (task_id, run_id, agent_name, implementer, "running", input_prompt, now),
-        )
-        await self.db.commit()
+        async with self._writing():
+            cursor = await self.db.execute(
+                "INSERT INTO agent_executions "
+                "(task_id, run_id, agent_name, implementer, status, input_prompt, started_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (task_id, run_id, agent_name, implementer, "running", input_prompt, now),
+            )
         return cursor.lastrowid
 
     async def finish_execution(
@@ -292,28 +558,37 @@ class StateStore:
         tokens_used: dict | None = None,
     ) -> None:
         tokens_json = json.dumps(tokens_used) if tokens_used else None
-        await self.db.execute(
-            "UPDATE agent_executions SET status = ?, output = ?, error = ?, "
-            "tokens_used = ?, finished_at = ? WHERE id = ?",
-            (status, output, error, tokens_json, _now(), execution_id),
-        )
-        await self.db.commit()
+        async with self._writing():
+            await self.db.execute(
+                "UPDATE agent_executions SET status = ?, output = ?, error = ?, "
+                "tokens_used = ?, finished_at = ? WHERE id = ?",
+                (status, output, error, tokens_json, _now(), execution_id),
+            )
 
     # ── Summary ───────────────────────────────────────────────────────
 
-    async def get_run_summary(self, run_id: str) -> dict:
-        """Get a summary of task statuses for a run."""
-        run = await self.get_run(run_id)
-        tasks = await self.list_tasks(run_id)
+    async def get_status_counts(self, run_id: str) -> dict[str, int]:
+        """Count a run's tasks per status without fetching the tasks."""
+        async with self.db.execute(
+            "SELECT status, COUNT(*) FROM tasks WHERE run_id = ? GROUP BY status", (run_id,)
+        ) as cursor:
+            cursor.row_factory = None
+            return {status: count for status, count in await cursor.fetchall()}
 
-        status_counts: dict[str, int] = {}
-        for t in tasks:
-            s = t["status"]
-            status_counts[s] = status_counts.get(s, 0) + 1
+    async def get_run_summary(self, run_id: str, include_tasks: bool = False) -> dict:
+        """Get a summary of task statuses for a run.
 
-        return {
+        The task rows themselves are only fetched (under ``"tasks"``) when
+        ``include_tasks`` is set.
+        """
+        run = await self.get_run(run_id)
+        status_counts = await self.get_status_counts(run_id)
+
+        summary = {
             "run": run,
-            "total_tasks": len(tasks),
+            "total_tasks": sum(status_counts.values()),
             "status_counts": status_counts,
-            "tasks": tasks,
         }
+        if include_tasks:
+            summary["tasks"] = await self.list_tasks(run_id)
+        return summary
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any, Callable, Coroutine
 
@@ -45,47 +46,111 @@ class TaskQueue:
             run_id: The run to execute tasks for.
             executor: Async callable that takes a task dict and returns a TaskResult.
         """
-        running_tasks: set[asyncio.Task] = set()
-        
-        while True:
-            pending = await self.state.get_pending_tasks(run_id)
-            
-            # Launch new tasks up to the concurrency limit
-            launched = 0
-            for task in pending:
-                if len(running_tasks) >= self.max_parallel:
-                    break
-                await self.state.update_task_status(task["id"], TaskStatus.QUEUED)
-                t = asyncio.create_task(self._run_single(task, executor))
-                running_tasks.add(t)
-                launched += 1
-            
-            if launched > 0:
-                all_tasks = await self.state.list_tasks(run_id)
-                total = len(all_tasks)
-                done_count = sum(
-                    1 for t in all_tasks
-                    if t["status"] in (TaskStatus.COMPLETED.value, TaskStatus.FAILED.value)
-                )
-                console.print(
-                    f"  [dim]Progress: {done_count}/{total} done, "
-                    f"{len(running_tasks)} running, {len(pending) - launched} waiting[/]"
-                )
-            
-            if running_tasks:
-                done, running_tasks = await asyncio.wait(
-                    running_tasks,
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-            elif not pending:
-                # Nothing running and nothing pending - we're done
-                break
-            else:
-                # Pending tasks exist but none could be launched (shouldn't happen)
-                await asyncio.sleep(0.5)
+        ready = self._init_graph(await self.state.list_tasks(run_id))
+        if not ready:
+            return []
+
+        # A fixed pool of workers bounds concurrency; each pulls the
+        # highest-priority ready task as soon as it is free.
+        self._queue: asyncio.PriorityQueue[tuple[int, dict | None]] = asyncio.PriorityQueue()
+        self._in_flight = 0
+        await self._enqueue(ready)
+        workers = [asyncio.ensure_future(self._worker(executor)) for _ in range(self.max_parallel)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # A state-store error killed a worker; don't leave the rest running.
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
 
         return list(self._results.values())
 
+    async def _enqueue(self, ready: list[tuple[int, dict]]) -> None:
+        """Mark newly ready tasks QUEUED in one commit and hand them to the workers."""
+        if not ready:
+            return
+        await self.state.update_tasks_status([task["id"] for _, task in ready], TaskStatus.QUEUED)
+        for item in ready:
+            self._queue.put_nowait(item)
+
+    async def _worker(
+        self,
+        executor: Callable[[dict], Coroutine[Any, Any, TaskResult]],
+    ) -> None:
+        while True:
+            _, task = await self._queue.get()
+            if task is None:
+                return
+            self._in_flight += 1
+            console.print(
+                f"  [dim]Progress: {self._done_count}/{self._total} done, "
+                f"{self._in_flight} running, {self._queue.qsize()} waiting[/]"
+            )
+
+            try:
+                await self._run_single(task, executor)
+                self._done_count += 1
+                result = self._results.get(task["id"])
+                if result is not None and result.success:
+                    await self._enqueue(self._release_dependents(task["id"]))
+            finally:
+                # Only count this task finished once its dependents are queued,
+                # so no other worker sees an idle, empty queue in between.
+                # Runs on errors too, so the other workers still get stopped.
+                self._in_flight -= 1
+                if self._in_flight == 0 and self._queue.empty():
+                    # Nothing running and nothing ready: stop every worker.
+                    for i in range(self.max_parallel):
+                        self._queue.put_nowait((self._total + i, None))
+
+    def _init_graph(self, tasks: list[dict]) -> list[tuple[int, dict]]:
+        """Index the run's dependency graph once and return the tasks ready now.
+
+        Pending tasks whose dependencies are all completed start out ready;
+        the rest wait until their last unmet dependency succeeds. Tasks
+        depending on a failed or unknown task are never started. Ready
+        tasks are paired with their position in list_tasks order (priority,
+        then age), which is the order workers pick them up in.
+        """
+        completed = {t["id"] for t in tasks if t["status"] == TaskStatus.COMPLETED.value}
+        self._total = len(tasks)
+        self._done_count = sum(
+            1 for t in tasks
+            if t["status"] in (TaskStatus.COMPLETED.value, TaskStatus.FAILED.value)
+        )
+        self._tasks_by_id: dict[str, dict] = {}
+        self._order: dict[str, int] = {}
+        self._unmet: dict[str, int] = {}
+        self._dependents: dict[str, list[str]] = defaultdict(list)
+        ready: list[tuple[int, dict]] = []
+
+        for position, task in enumerate(tasks):
+            if task["status"] != TaskStatus.PENDING.value:
+                continue
+            task_id = task["id"]
+            self._tasks_by_id[task_id] = task
+            self._order[task_id] = position
+            unmet = [
+                dep for dep in StateStore.parse_dependencies(task) if dep not in completed
+            ]
+            self._unmet[task_id] = len(unmet)
+            for dep in unmet:
+                self._dependents[dep].append(task_id)
+            if not unmet:
+                ready.append((position, task))
+        return ready
+
+    def _release_dependents(self, task_id: str) -> list[tuple[int, dict]]:
+        """Record that ``task_id`` succeeded; return the dependents that became ready."""
+        ready = []
+        for dependent in self._dependents.pop(task_id, ()):
+            self._unmet[dependent] -= 1
+            if self._unmet[dependent] == 0:
+                ready.append((self._order[dependent], self._tasks_by_id[dependent]))
+        return ready
+
     async def _run_single(
         self,
         task: dict,
@@ -20,7 +20,7 @@ class TicketPriority(str, Enum):
     LOW = "low"
 
 
-@dataclass
+@dataclass(slots=True)
 class Ticket:
     """A work item to be processed by agents."""
 
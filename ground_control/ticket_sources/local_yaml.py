@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import yaml
@@ -13,6 +17,23 @@ from ground_control.ticket_sources.base import (
     TicketStatus,
 )
 
+# libyaml bindings when PyYAML was built with them.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Upper bound on threads reading and parsing ticket files at once.
+MAX_PARSE_WORKERS = 8
+
+
+@dataclass(slots=True)
+class _ParsedFile:
+    """A YAML file's parsed document and the tickets built from it."""
+
+    data: object
+    tickets: list[Ticket]
+    # Raw ticket mappings inside ``data`` by ID, for in-place status edits.
+    items_by_id: dict[str, dict]
+
 
 class LocalYAMLTicketSource(BaseTicketSource):
     """Loads tickets from YAML files in a local directory.
@@ -24,38 +45,43 @@ class LocalYAMLTicketSource(BaseTicketSource):
 
     def __init__(self, path: str | Path):
         self.path = Path(path)
+        # Parsed files, reused while the file's mtime is unchanged.
+        self._cache: dict[Path, tuple[int, _ParsedFile]] = {}
 
     async def load_tickets(self) -> list[Ticket]:
-        if not self.path.exists():
+        files = await asyncio.to_thread(self._files_in_load_order)
+        if not files:
             return []
-
-        tickets: list[Ticket] = []
-
-        single_file = self.path / "tickets.yaml"
-        if single_file.exists():
-            tickets.extend(self._load_from_file(single_file))
-
-        for yaml_file in sorted(self.path.glob("*.yaml")):
-            if yaml_file.name == "tickets.yaml":
-                continue
-            tickets.extend(self._load_from_file(yaml_file))
-
-        for yml_file in sorted(self.path.glob("*.yml")):
-            tickets.extend(self._load_from_file(yml_file))
-
-        seen_ids: set[str] = set()
-        unique: list[Ticket] = []
+        # Parse in worker threads so the event loop keeps serving other tasks.
+        # A pool of our own keeps a large ticket directory from occupying
+        # every thread of the loop's default executor.
+        loop = asyncio.get_running_loop()
+        pool = ThreadPoolExecutor(
+            max_workers=min(MAX_PARSE_WORKERS, len(files)), thread_name_prefix="ticket-yaml"
+        )
+        try:
+            per_file = await asyncio.gather(
+                *(loop.run_in_executor(pool, self._load_from_file, f) for f in files)
+            )
+        finally:
+            pool.shutdown(wait=False)
+        tickets = [t for file_tickets in per_file for t in file_tickets]
+
+        # First occurrence of each ID wins, in load order.
+        unique: dict[str, Ticket] = {}
         for t in tickets:
-            if t.id not in seen_ids:
-                seen_ids.add(t.id)
-                unique.append(t)
-        return unique
+            unique.setdefault(t.id, t)
+        return list(unique.values())
 
     async def get_ticket(self, ticket_id: str) -> Ticket | None:
-        tickets = await self.load_tickets()
-        for t in tickets:
-            if t.id == ticket_id:
-                return t
+        return await asyncio.to_thread(self._find_ticket, ticket_id)
+
+    def _find_ticket(self, ticket_id: str) -> Ticket | None:
+        # Same precedence as load_tickets, but stop at the first file that has it.
+        for yaml_file in self._files_in_load_order():
+            for t in self._load_from_file(yaml_file):
+                if t.id == ticket_id:
+                    return t
         return None
 
     async def update_ticket_status(self, ticket_id: str, status: TicketStatus) -> None:
@@ -63,33 +89,60 @@ class LocalYAMLTicketSource(BaseTicketSource):
 
         Scans all files to find the ticket and rewrites the file with the new status.
         """
-        for yaml_file in self._all_yaml_files():
-            if self._update_in_file(yaml_file, ticket_id, status):
-                return
-        raise KeyError(f"Ticket '{ticket_id}' not found in any YAML file.")
+        if not await asyncio.to_thread(self._update_status, ticket_id, status):
+            raise KeyError(f"Ticket '{ticket_id}' not found in any YAML file.")
+
+    def _update_status(self, ticket_id: str, status: TicketStatus) -> bool:
+        return any(
+            self._update_in_file(yaml_file, ticket_id, status)
+            for yaml_file in self._all_yaml_files()
+        )
+
+    def _files_in_load_order(self) -> list[Path]:
+        # tickets.yaml first, then the other .yaml files, then .yml files.
+        return sorted(
+            self._all_yaml_files(),
+            key=lambda p: (p.name != "tickets.yaml", p.suffix == ".yml", p.name),
+        )
 
     def _all_yaml_files(self) -> list[Path]:
-        if not self.path.exists():
+        """YAML files in the directory, sorted; one directory read."""
+        try:
+            with os.scandir(self.path) as entries:
+                return sorted(
+                    Path(e.path) for e in entries
+                    if e.name.endswith((".yaml", ".yml")) and e.is_file()
+                )
+        except FileNotFoundError:
             return []
-        files = list(self.path.glob("*.yaml")) + list(self.path.glob("*.yml"))
-        return sorted(files)
 
     def _load_from_file(self, path: Path) -> list[Ticket]:
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        return self._parsed(path).tickets
 
-        if data is None:
-            return []
+    def _parsed(self, path: Path) -> _ParsedFile:
+        mtime_ns = path.stat().st_mtime_ns
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
 
-        if isinstance(data, list):
-            return [self._parse_ticket(item) for item in data]
+        parsed = self._parse_file(path)
+        self._cache[path] = (mtime_ns, parsed)
+        return parsed
 
-        if isinstance(data, dict):
-            if "tickets" in data:
-                return [self._parse_ticket(item) for item in data["tickets"]]
-            return [self._parse_ticket(data)]
+    def _parse_file(self, path: Path) -> _ParsedFile:
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader)
 
-        return []
+        items: list[dict] = []
+        if isinstance(data, list):
+            items = data
+        elif isinstance(data, dict):
+            items = data["tickets"] if "tickets" in data else [data]
+
+        items_by_id: dict[str, dict] = {}
+        for item in items:
+            items_by_id.setdefault(str(item.get("id", "")), item)
+        return _ParsedFile(data, [self._parse_ticket(item) for item in items], items_by_id)
 
     def _parse_ticket(self, data: dict) -> Ticket:
         return Ticket(
@@ -105,29 +158,14 @@ class LocalYAMLTicketSource(BaseTicketSource):
         )
 
     def _update_in_file(self, path: Path, ticket_id: str, status: TicketStatus) -> bool:
-        with open(path) as f:
-            data = yaml.safe_load(f)
-
-        if data is None:
+        parsed = self._parsed(path)
+        item = parsed.items_by_id.get(ticket_id)
+        if item is None:
             return False
 
-        items: list[dict] | None = None
-        if isinstance(data, list):
-            items = data
-        elif isinstance(data, dict) and "tickets" in data:
-            items = data["tickets"]
-        elif isinstance(data, dict) and str(data.get("id", "")) == ticket_id:
-            data["status"] = status.value
-            with open(path, "w") as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-            return True
-
-        if items:
-            for item in items:
-                if str(item.get("id", "")) == ticket_id:
-                    item["status"] = status.value
-                    with open(path, "w") as f:
-                        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-                    return True
-
-        return False
+        item["status"] = status.value
+        with open(path, "w") as f:
+            yaml.dump(parsed.data, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+        # The document was edited in place; reparse it on the next read.
+        self._cache.pop(path, None)
+        return True
@@ -0,0 +1,18 @@
+"""Shared pytest configuration."""
+
+from __future__ import annotations
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # not installed, or Windows
+    uvloop = None
+
+
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the async tests on uvloop, like the CLI does when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
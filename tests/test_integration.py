@@ -3,43 +3,130 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
 import os
 import shutil
-import tempfile
+import sqlite3
+import uuid
+from dataclasses import dataclass
 from pathlib import Path
 
+import httpx
 import pytest
+import typer
 import yaml
+from openai import AsyncOpenAI
 
+from ground_control.__main__ import _prune_subcommands
 from ground_control.agent_manager import AgentManager
-from ground_control.config import load_project_config, ProjectConfig, get_base_dir
-from ground_control.state import StateStore, RunStatus, TaskStatus
+from ground_control.cli import app
+from ground_control.cli_agents import agents_app
+from ground_control.cli_tickets import tickets_app
+from ground_control.config import load_project_config, get_base_dir, _load_yaml
+from ground_control.env import get_api_key, get_api_keys, load_environment
+from ground_control.implementers.claude_code import ClaudeCodeImplementer
+from ground_control.llm import get_provider, http
+from ground_control.llm.base import BaseLLMProvider, LLMResponse
+from ground_control.llm.cache import FileCacheBackend, LLMCache
+from ground_control.llm.rate_limit import AsyncRateLimiter
+from ground_control.state import _SCHEMA, _SCHEMA_VERSION, StateStore, RunStatus, TaskStatus, iso
 from ground_control.ticket_sources.local_yaml import LocalYAMLTicketSource
-from ground_control.ticket_sources.base import TicketStatus, TicketPriority
-from ground_control.planner import PlannedTask
+from ground_control.ticket_sources.base import Ticket, TicketStatus, TicketPriority
+from ground_control.orchestrator import Orchestrator
+from ground_control.planner import Planner
 from ground_control.task_queue import TaskQueue, TaskResult
 
 
+# libyaml-backed dumper when PyYAML was built with it.
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+SAMPLE_TICKETS = [
+    {
+        "id": "TICKET-001",
+        "title": "Add user authentication endpoint",
+        "description": "Create a POST /auth/login endpoint that accepts email and password",
+        "priority": "high",
+        "status": "open",
+        "labels": ["backend", "auth"],
+        "acceptance_criteria": [
+            "Endpoint returns JWT token on success",
+            "Returns 401 on invalid credentials",
+        ],
+    },
+    {
+        "id": "TICKET-002",
+        "title": "Add health check endpoint",
+        "description": "Create a GET /health endpoint that returns service status",
+        "priority": "low",
+        "status": "open",
+        "labels": ["backend", "ops"],
+        "acceptance_criteria": [
+            "Returns 200 with JSON body",
+            "Includes uptime and version info",
+        ],
+    },
+    {
+        "id": "TICKET-003",
+        "title": "Already done ticket",
+        "description": "This ticket is already completed",
+        "priority": "medium",
+        "status": "done",
+    },
+]
+
+# Static, so serialized and encoded once for the whole module.
+SAMPLE_TICKETS_YAML = yaml.dump(
+    SAMPLE_TICKETS, Dumper=_YamlDumper, default_flow_style=False
+).encode()
+
+
+@dataclass(frozen=True, slots=True)
+class Workspace:
+    """Paths of a test workspace, as laid out by the ``workspace`` fixture."""
+
+    root: Path
+    agents_dir: Path
+    projects_dir: Path
+    project_yaml: Path
+    tickets_dir: Path
+    db_path: Path
+
+
+@pytest.fixture(scope="session")
+def _agents_dir(tmp_path_factory):
+    """The repo's agent definitions, copied once per session."""
+    agents_dir = tmp_path_factory.mktemp("agents")
+    for agent_file in (get_base_dir() / "agents").glob("*.md"):
+        shutil.copy2(agent_file, agents_dir / agent_file.name)
+    return agents_dir
+
+
+@pytest.fixture(scope="session")
+def _workspace_template(tmp_path_factory):
+    """The workspace files that don't depend on its location, built once per session."""
+    template = tmp_path_factory.mktemp("workspace-template")
+    for directory in ("projects", "tickets", "fake-repo"):
+        (template / directory).mkdir()
+    (template / "tickets" / "tickets.yaml").write_bytes(SAMPLE_TICKETS_YAML)
+    return template
+
+
 @pytest.fixture
-def workspace(tmp_path):
-    """Create a full ground-control workspace for testing."""
+def workspace(tmp_path, _workspace_template, _agents_dir):
+    """Create a full ground-control workspace for testing and return its paths."""
+    # Tests write to their workspace (ticket statuses), so each gets its
+    # own copy of the template. The agent files are only read and share
+    # one directory; AgentManager replaces its cache file atomically.
+    shutil.copytree(_workspace_template, tmp_path, dirs_exist_ok=True)
     agents_dir = tmp_path / "agents"
+    try:
+        agents_dir.symlink_to(_agents_dir, target_is_directory=True)
+    except OSError:  # no symlink privilege (Windows)
+        shutil.copytree(_agents_dir, agents_dir)
     projects_dir = tmp_path / "projects"
     tickets_dir = tmp_path / "tickets"
-
-    agents_dir.mkdir()
-    projects_dir.mkdir()
-    tickets_dir.mkdir()
-
-    # Copy agent files from the repo's agents directory
-    base = get_base_dir()
-    source_agents = base / "agents"
-    for agent_file in source_agents.glob("*.md"):
-        shutil.copy2(agent_file, agents_dir / agent_file.name)
-
-    # Create a fake repo path
     repo_dir = tmp_path / "fake-repo"
-    repo_dir.mkdir()
 
     project_config = {
         "name": "test-project",
@@ -61,63 +148,99 @@ def workspace(tmp_path):
         },
     }
 
-    project_file = projects_dir / "test-project.yaml"
-    with open(project_file, "w") as f:
-        yaml.dump(project_config, f, default_flow_style=False)
-
-    sample_tickets = [
-        {
-            "id": "TICKET-001",
-            "title": "Add user authentication endpoint",
-            "description": "Create a POST /auth/login endpoint that accepts email and password",
-            "priority": "high",
-            "status": "open",
-            "labels": ["backend", "auth"],
-            "acceptance_criteria": [
-                "Endpoint returns JWT token on success",
-                "Returns 401 on invalid credentials",
-            ],
-        },
-        {
-            "id": "TICKET-002",
-            "title": "Add health check endpoint",
-            "description": "Create a GET /health endpoint that returns service status",
-            "priority": "low",
-            "status": "open",
-            "labels": ["backend", "ops"],
-            "acceptance_criteria": [
-                "Returns 200 with JSON body",
-                "Includes uptime and version info",
-            ],
-        },
-        {
-            "id": "TICKET-003",
-            "title": "Already done ticket",
-            "description": "This ticket is already completed",
-            "priority": "medium",
-            "status": "done",
-        },
-    ]
-
-    tickets_file = tickets_dir / "tickets.yaml"
-    with open(tickets_file, "w") as f:
-        yaml.dump(sample_tickets, f, default_flow_style=False)
-
+    ws = Workspace(
+        root=tmp_path,
+        agents_dir=agents_dir,
+        projects_dir=projects_dir,
+        project_yaml=projects_dir / "test-project.yaml",
+        tickets_dir=tickets_dir,
+        db_path=tmp_path / "test.db",
+    )
     gc_config = {
         "agents_dir": str(agents_dir),
         "projects_dir": str(projects_dir),
-        "db_path": str(tmp_path / "test.db"),
+        "db_path": str(ws.db_path),
+    }
+
+    # Serialized up front; each file is then a single write.
+    files = {
+        ws.project_yaml: yaml.dump(
+            project_config, Dumper=_YamlDumper, default_flow_style=False
+        ).encode(),
+        tmp_path / "gc.yaml": yaml.dump(gc_config, Dumper=_YamlDumper).encode(),
     }
-    gc_yaml = tmp_path / "gc.yaml"
-    with open(gc_yaml, "w") as f:
-        yaml.dump(gc_config, f)
+    for path, data in files.items():
+        path.write_bytes(data)
 
-    return tmp_path
+    return ws
+
+
+@pytest.fixture
+async def state_store():
+    """An initialized StateStore backed by a private in-memory database."""
+    state = StateStore(f"file:state-{uuid.uuid4().hex}?mode=memory&cache=shared", uri=True)
+    await state.initialize()
+    yield state
+    await state.close()
+
+
+@contextlib.contextmanager
+def _direct_read(state: StateStore):
+    """A synchronous, read-only sqlite3 connection to ``state``'s database.
+
+    Checks what was committed without going through StateStore's own reads.
+    Works for the state_store fixture's shared-cache URI and for files.
+    """
+    conn = sqlite3.connect(state.db_path, uri=state.uri)
+    try:
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = 1")
+        yield conn
+    finally:
+        conn.close()
+
+
+@pytest.fixture(scope="session")
+def _db_template(tmp_path_factory):
+    """An empty database with the current schema, created once per session."""
+    path = tmp_path_factory.mktemp("db") / "template.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA)
+    conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def db_path(tmp_path, _db_template):
+    """A per-test copy of the template database; StateStore skips the DDL on it."""
+    path = tmp_path / "test.db"
+    shutil.copyfile(_db_template, path)
+    return path
+
+
+class TestCLI:
+    def test_import_registers_every_subcommand(self):
+        assert {group.name for group in app.registered_groups} == {"agents", "tickets"}
+
+    @pytest.mark.parametrize(
+        "command, groups",
+        [("status", []), ("agents", ["agents"]), (None, ["agents", "tickets"])],
+    )
+    def test_main_prunes_unreachable_subcommands(self, command, groups):
+        root = typer.Typer()
+        root.command("status")(lambda: None)
+        root.add_typer(agents_app, name="agents")
+        root.add_typer(tickets_app, name="tickets")
+
+        _prune_subcommands(root, command)
+
+        assert [group.name for group in root.registered_groups] == groups
 
 
 class TestAgentManager:
     def test_load_default_agents(self, workspace):
-        manager = AgentManager(workspace / "agents")
+        manager = AgentManager(workspace.agents_dir)
         agents = manager.load_all()
 
         assert len(agents) == 4
@@ -127,7 +250,7 @@ class TestAgentManager:
         assert "product-manager" in agents
 
     def test_get_agent(self, workspace):
-        manager = AgentManager(workspace / "agents")
+        manager = AgentManager(workspace.agents_dir)
         manager.load_all()
 
         dev = manager.get("developer")
@@ -139,60 +262,435 @@ class TestAgentManager:
         assert len(dev.system_prompt) > 0
 
     def test_get_missing_agent_raises(self, workspace):
-        manager = AgentManager(workspace / "agents")
+        manager = AgentManager(workspace.agents_dir)
         manager.load_all()
 
         with pytest.raises(KeyError, match="nonexistent"):
             manager.get("nonexistent")
 
+    def test_load_all_reuses_cache(self, workspace, monkeypatch):
+        AgentManager(workspace.agents_dir).load_all()
+        assert (workspace.agents_dir / ".cache" / "agents.json").exists()
+
+        def fail_parse(self, path, data):
+            raise AssertionError(f"{path} should have come from the cache")
+
+        monkeypatch.setattr(AgentManager, "_parse_agent_data", fail_parse)
+        agents = AgentManager(workspace.agents_dir).load_all()
+        assert agents["developer"].role == "Senior Software Developer"
+
+    def test_parse_frontmatter(self, tmp_path):
+        (tmp_path / "qa-engineer.md").write_text(
+            "---\n"
+            "role: 'QA: Engineer'\n"
+            "llm_provider: openai\n"
+            "llm_model: gpt-4o\n"
+            "capabilities:\n"
+            "  - run_tests\n"
+            "  - \"write_tests\"\n"
+            "---\n"
+            "\n# QA Agent\n"
+        )
+        manager = AgentManager(tmp_path)
+        agent = manager.get("qa-engineer")
+
+        assert agent.role == "QA: Engineer"
+        assert agent.llm_provider == "openai"
+        assert agent.llm_model == "gpt-4o"
+        assert agent.capabilities == ["run_tests", "write_tests"]
+        assert agent.system_prompt == "# QA Agent"
+
+    def test_parse_frontmatter_yaml_fallback(self, tmp_path):
+        (tmp_path / "custom.md").write_text(
+            "---\n"
+            "name: custom  # inline comment\n"
+            "capabilities: [plan, review]\n"
+            "---\n"
+            "Body\n"
+        )
+        manager = AgentManager(tmp_path)
+        agent = manager.get("custom")
+
+        assert agent.role == "Custom"
+        assert agent.capabilities == ["plan", "review"]
+        assert agent.system_prompt == "Body"
+
+    def test_parse_without_frontmatter(self, tmp_path):
+        (tmp_path / "code-reviewer.md").write_text("# Reviewer\n\nReview every diff.\n")
+        manager = AgentManager(tmp_path)
+        agent = manager.get("code-reviewer")
+
+        assert agent.role == "Code Reviewer"
+        assert agent.llm_provider == "anthropic"
+        assert agent.capabilities == ()
+        assert agent.system_prompt == "# Reviewer\n\nReview every diff."
+
 
 class TestProjectConfig:
     def test_load_project_config(self, workspace):
-        config = load_project_config(workspace / "projects" / "test-project.yaml")
+        config = load_project_config(workspace.project_yaml)
 
         assert config.name == "test-project"
         assert config.structure.language == "python"
         assert config.structure.framework == "fastapi"
         assert config.ticket_source.type == "local_yaml"
+        assert Path(config.ticket_source.path) == workspace.tickets_dir
         assert config.settings.max_parallel_agents == 2
         assert "developer" in config.agents
 
     def test_missing_config_raises(self, workspace):
         with pytest.raises(FileNotFoundError):
-            load_project_config(workspace / "projects" / "nonexistent.yaml")
+            load_project_config(workspace.projects_dir / "nonexistent.yaml")
 
+    def test_load_project_config_uses_json_sidecar(self, workspace, monkeypatch):
+        project_file = workspace.project_yaml
+        load_project_config(project_file)
+        assert (workspace.projects_dir / ".cache" / "test-project.yaml.json").exists()
 
-class TestTicketSource:
+        def fail_load(*args, **kwargs):
+            raise AssertionError("config should have come from the sidecar")
+
+        _load_yaml.cache_clear()
+        monkeypatch.setattr(yaml, "load", fail_load)
+        config = load_project_config(project_file)
+        assert config.structure.framework == "fastapi"
+
+
+class TestLLMCache:
     @pytest.mark.asyncio
-    async def test_load_tickets(self, workspace):
-        config = load_project_config(workspace / "projects" / "test-project.yaml")
-        source = LocalYAMLTicketSource(config.ticket_source.path)
+    async def test_repeated_request_is_served_from_cache(self, tmp_path):
+        cache = LLMCache(FileCacheBackend(tmp_path / "llm"))
+        calls = 0
 
-        tickets = await source.load_tickets()
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return LLMResponse(content='{"tasks": []}', model="test-model", usage={"input_tokens": 3})
+
+        request = {"model": "test-model", "temperature": 0.2, "messages": [{"role": "user", "content": "hi"}]}
+        first = await cache.get_or_fetch(request, fetch)
+        second = await cache.get_or_fetch(dict(request), fetch)
+
+        assert calls == 1
+        assert second.content == first.content
+        assert second.usage == {"input_tokens": 3}
+        assert cache.stats == {"hits": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_high_temperature_bypasses_cache(self):
+        cache = LLMCache()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return LLMResponse(content="hi", model="test-model")
+
+        request = {"model": "test-model", "temperature": 0.7, "messages": []}
+        await cache.get_or_fetch(request, fetch)
+        await cache.get_or_fetch(request, fetch)
+
+        assert calls == 2
+        assert cache.stats == {"hits": 0, "misses": 0}
+
+
+class TestAPIKeys:
+    def test_calls_rotate_through_api_keys(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEYS", "key-a, key-b")
+        provider = get_provider("anthropic")
+
+        keys = [provider._next_client().api_key for _ in range(3)]
+
+        assert keys == ["key-a", "key-b", "key-a"]
+        assert get_api_key("anthropic") == "key-a"
+
+    def test_dotenv_key_lists_load_when_single_keys_are_exported(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("GC_SKIP_DOTENV", raising=False)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "exported-a")
+        monkeypatch.setenv("OPENAI_API_KEY", "exported-b")
+        # Registered so monkeypatch removes what load_dotenv() sets.
+        monkeypatch.setenv("ANTHROPIC_API_KEYS", "")
+        monkeypatch.delenv("ANTHROPIC_API_KEYS")
+        (tmp_path / ".env").write_text("ANTHROPIC_API_KEYS=key-a,key-b\n")
+
+        load_environment(tmp_path)
+
+        assert get_api_keys("anthropic") == ["key-a", "key-b"]
+
+
+class TestHTTPPool:
+    @pytest.mark.asyncio
+    async def test_providers_share_one_pool(self, monkeypatch):
+        monkeypatch.setattr(http, "_pools", {})
+        anthropic = get_provider("anthropic", api_key="key-a")
+        openai = get_provider("openai", api_key="key-b")
+        assert anthropic._http is openai._http
+        pool = openai._http
+
+        # Closing one provider leaves the pool open for the other.
+        await anthropic.aclose()
+        assert not pool.is_closed
+        await openai.aclose()
+        assert pool.is_closed
+
+    @pytest.mark.asyncio
+    async def test_pools_are_keyed_by_options(self, monkeypatch):
+        monkeypatch.setattr(http, "_pools", {})
+        default = get_provider("anthropic", api_key="key-a")
+        short = get_provider("anthropic", api_key="key-a", http_timeout=5.0)
+
+        also_short = get_provider("openai", api_key="key-b", http_timeout=5.0)
+
+        assert short._http is not default._http
+        assert also_short._http is short._http
+        for provider in (default, short, also_short):
+            await provider.aclose()
+
+
+class TestLowLevelProvider:
+    @pytest.mark.asyncio
+    async def test_anthropic_posts_directly(self):
+        def handler(request):
+            assert request.url.path == "/v1/messages"
+            assert request.headers["x-api-key"] == "key-a"
+            assert json.loads(request.content)["messages"] == [{"role": "user", "content": "hi"}]
+            return httpx.Response(200, json={
+                "model": "claude-test",
+                "content": [{"type": "text", "text": "hello"}],
+                "usage": {"input_tokens": 3, "output_tokens": 1},
+            })
+
+        provider = get_provider("anthropic", api_key="key-a", low_level=True)
+        provider._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        response = await provider.complete([{"role": "user", "content": "hi"}])
+
+        assert response.content == "hello"
+        assert response.usage == {"input_tokens": 3, "output_tokens": 1}
+        assert response.raw["model"] == "claude-test"
+
+    @pytest.mark.asyncio
+    async def test_openai_stream_keeps_raw_response(self):
+        events = [
+            {"choices": [{"index": 0, "delta": {"role": "assistant", "content": "hel"}}]},
+            {"choices": [{"index": 0, "delta": {"content": "lo"}, "finish_reason": "stop"}]},
+            {"choices": [], "usage": {
+                "prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4,
+            }},
+        ]
+        body = "".join(
+            "data: " + json.dumps({
+                "id": "chatcmpl-1", "object": "chat.completion.chunk", "created": 1,
+                "model": "gpt-test", **event,
+            }) + "\n\n"
+            for event in events
+        ) + "data: [DONE]\n\n"
+
+        def handler(request):
+            return httpx.Response(
+                200, content=body.encode(), headers={"content-type": "text/event-stream"}
+            )
+
+        provider = get_provider("openai", api_key="key-b")
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        provider._clients = [AsyncOpenAI(api_key="key-b", http_client=http_client)]
+
+        response = await provider.complete([{"role": "user", "content": "hi"}])
+
+        assert response.content == "hello"
+        assert response.raw["id"] == "chatcmpl-1"
+        assert response.raw["choices"][0]["message"]["content"] == "hello"
+        assert response.raw["choices"][0]["finish_reason"] == "stop"
+        assert response.raw["usage"]["total_tokens"] == 4
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_waits_when_token_budget_is_spent(self):
+        limiter = AsyncRateLimiter(rpm=1000, tpm=1000)
+        await limiter.acquire(1000)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire(100), timeout=0.05)
+
+
+class TestImplementers:
+    @pytest.mark.asyncio
+    async def test_cancelled_execution_kills_subprocess(self, tmp_path, monkeypatch):
+        pid_file = tmp_path / "pid"
+        fake_cli = tmp_path / "fake-claude"
+        fake_cli.write_text(f"#!/bin/sh\necho $$ > {pid_file}\nexec sleep 60\n")
+        fake_cli.chmod(0o755)
+        monkeypatch.setattr(ClaudeCodeImplementer, "COMMAND", str(fake_cli))
+
+        task = asyncio.create_task(ClaudeCodeImplementer().execute("prompt", str(tmp_path)))
+        while not pid_file.exists() or not pid_file.read_text().strip():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
+
+
+class _RecordingProvider(BaseLLMProvider):
+    """Records planning prompts and returns an empty plan."""
+
+    def __init__(self):
+        super().__init__(default_model="recorder")
+        self.prompts: list[str] = []
+
+    async def complete(self, messages, **kwargs):
+        raise NotImplementedError
+
+    async def complete_json(self, messages, **kwargs):
+        self.prompts.append(messages[-1]["content"])
+        return {"tasks": []}
+
+
+class TestPlanner:
+    @pytest.mark.asyncio
+    async def test_long_tickets_are_truncated_over_budget(self, workspace):
+        config = load_project_config(workspace.project_yaml)
+        config.settings.max_planning_input_tokens = 100
+        ticket = Ticket(
+            id="T-1",
+            title="Long ticket",
+            description="x" * 2000,
+            acceptance_criteria=[f"criterion {i}" for i in range(5)],
+        )
+        provider = _RecordingProvider()
+
+        await Planner(provider, config).plan([ticket], [])
+
+        tickets_json = provider.prompts[0].split("\n\n", 2)[1]
+        (sent,) = json.loads(tickets_json)
+        assert sent["description"] == "x" * 512 + "...[truncated]"
+        assert sent["acceptance_criteria"] == ["criterion 0", "criterion 1", "criterion 2"]
+
+
+class _StalledProvider(_RecordingProvider):
+    async def warm_up(self, connections=4):
+        await asyncio.Event().wait()
+
+    async def complete_json(self, messages, **kwargs):
+        await asyncio.Event().wait()
+
+
+class TestOrchestrator:
+    @pytest.mark.asyncio
+    async def test_planning_timeout_fails_the_run(self, workspace):
+        config = load_project_config(workspace.project_yaml)
+        config.settings.phase_timeout = 0.05
+        agent_manager = AgentManager(workspace.agents_dir)
+        agent_manager.load_all()
+        state = StateStore(workspace.db_path)
+        await state.initialize()
+        try:
+            orchestrator = Orchestrator(config, agent_manager, state, _StalledProvider())
+
+            with pytest.raises(TimeoutError, match="Planning timed out"):
+                await orchestrator.run()
+
+            (run,) = await state.list_runs()
+            assert run["status"] == RunStatus.FAILED.value
+
+            # A warm-up that never finishes neither holds up planning nor
+            # outlives the run.
+            warm_up = orchestrator._warm_up
+            assert not warm_up.done()
+            await orchestrator.cleanup()
+            assert warm_up.cancelled()
+        finally:
+            await state.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_status_write_cancels_ticket_loading(
+        self, workspace, state_store, monkeypatch
+    ):
+        config = load_project_config(workspace.project_yaml)
+        agent_manager = AgentManager(workspace.agents_dir)
+        agent_manager.load_all()
+        loading = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def stalled_load(self):
+            loading.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def failing_update(run_id, status):
+            await loading.wait()
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(LocalYAMLTicketSource, "load_tickets", stalled_load)
+        monkeypatch.setattr(state_store, "update_run_status", failing_update)
+        orchestrator = Orchestrator(config, agent_manager, state_store, _RecordingProvider())
+
+        with pytest.raises(sqlite3.OperationalError):
+            await orchestrator.run()
+
+        assert cancelled.is_set()
+        await orchestrator.cleanup()
+
+
+@pytest.fixture
+def ticket_source(workspace):
+    """The workspace's ticket source, without parsing the project config for its path."""
+    return LocalYAMLTicketSource(workspace.tickets_dir)
+
+
+class TestTicketSource:
+    @pytest.mark.asyncio
+    async def test_load_tickets(self, ticket_source):
+        tickets = await ticket_source.load_tickets()
         assert len(tickets) == 3
 
         open_tickets = [t for t in tickets if t.status == TicketStatus.OPEN]
         assert len(open_tickets) == 2
 
     @pytest.mark.asyncio
-    async def test_get_ticket(self, workspace):
-        config = load_project_config(workspace / "projects" / "test-project.yaml")
-        source = LocalYAMLTicketSource(config.ticket_source.path)
-
-        ticket = await source.get_ticket("TICKET-001")
+    async def test_get_ticket(self, ticket_source):
+        ticket = await ticket_source.get_ticket("TICKET-001")
         assert ticket is not None
         assert ticket.title == "Add user authentication endpoint"
         assert ticket.priority == TicketPriority.HIGH
 
     @pytest.mark.asyncio
-    async def test_update_ticket_status(self, workspace):
-        config = load_project_config(workspace / "projects" / "test-project.yaml")
-        source = LocalYAMLTicketSource(config.ticket_source.path)
+    async def test_get_ticket_uses_load_order(self, tmp_path):
+        (tmp_path / "a.yaml").write_text("id: T-1\ntitle: From a.yaml\n")
+        (tmp_path / "tickets.yaml").write_text("- id: T-1\n  title: From tickets.yaml\n")
+        source = LocalYAMLTicketSource(tmp_path)
 
-        await source.update_ticket_status("TICKET-001", TicketStatus.IN_PROGRESS)
+        assert (await source.get_ticket("T-1")).title == "From tickets.yaml"
+        assert await source.get_ticket("T-2") is None
+
+    @pytest.mark.asyncio
+    async def test_update_ticket_status(self, ticket_source):
+        await ticket_source.update_ticket_status("TICKET-001", TicketStatus.IN_PROGRESS)
+
+        ticket = await ticket_source.get_ticket("TICKET-001")
+        assert ticket.status == TicketStatus.IN_PROGRESS
+
+    @pytest.mark.asyncio
+    async def test_files_are_reparsed_only_when_changed(self, ticket_source, monkeypatch):
+        source = ticket_source
+        parsed = []
+        parse_file = source._parse_file
+        monkeypatch.setattr(source, "_parse_file", lambda path: parsed.append(path) or parse_file(path))
 
+        await source.load_tickets()
+        await source.load_tickets()
+        assert len(parsed) == 1
+
+        await source.update_ticket_status("TICKET-001", TicketStatus.IN_PROGRESS)
         ticket = await source.get_ticket("TICKET-001")
         assert ticket.status == TicketStatus.IN_PROGRESS
+        assert len(parsed) == 2
 
     @pytest.mark.asyncio
     async def test_empty_directory(self, tmp_path):
@@ -205,28 +703,20 @@ class TestTicketSource:
 
 class TestStateStore:
     @pytest.mark.asyncio
-    async def test_create_and_get_run(self, tmp_path):
-        state = StateStore(tmp_path / "test.db")
-        await state.initialize()
-
-        run = await state.create_run("run-001", "test-project")
+    async def test_create_and_get_run(self, state_store):
+        run = await state_store.create_run("run-001", "test-project")
         assert run["id"] == "run-001"
         assert run["status"] == "pending"
 
-        fetched = await state.get_run("run-001")
+        fetched = await state_store.get_run("run-001")
         assert fetched is not None
         assert fetched["project_name"] == "test-project"
 
-        await state.close()
-
     @pytest.mark.asyncio
-    async def test_task_lifecycle(self, tmp_path):
-        state = StateStore(tmp_path / "test.db")
-        await state.initialize()
-
-        await state.create_run("run-001", "test-project")
+    async def test_task_lifecycle(self, state_store):
+        await state_store.create_run("run-001", "test-project")
 
-        task = await state.create_task(
+        task = await state_store.create_task(
             task_id="task-001",
             run_id="run-001",
             title="Implement login",
@@ -236,149 +726,331 @@ class TestStateStore:
         )
         assert task["status"] == "pending"
 
-        await state.update_task_status("task-001", TaskStatus.RUNNING)
-        fetched = await state.get_task("task-001")
-        assert fetched["status"] == "running"
+        query = "SELECT status, result FROM tasks WHERE id = 'task-001'"
+        await state_store.update_task_status("task-001", TaskStatus.RUNNING)
+        with _direct_read(state_store) as db:
+            assert tuple(db.execute(query).fetchone()) == ("running", None)
 
-        await state.update_task_status("task-001", TaskStatus.COMPLETED, result="Done")
-        fetched = await state.get_task("task-001")
+        await state_store.update_task_status("task-001", TaskStatus.COMPLETED, result="Done")
+        fetched = await state_store.get_task("task-001")
         assert fetched["status"] == "completed"
         assert fetched["result"] == "Done"
 
-        await state.close()
-
     @pytest.mark.asyncio
-    async def test_dependency_resolution(self, tmp_path):
-        state = StateStore(tmp_path / "test.db")
-        await state.initialize()
-
-        await state.create_run("run-001", "test-project")
-
-        await state.create_task("task-a", "run-001", "Task A")
-        await state.create_task("task-b", "run-001", "Task B", dependencies=["task-a"])
-        await state.create_task("task-c", "run-001", "Task C")
-
-        pending = await state.get_pending_tasks("run-001")
+    async def test_dependency_resolution(self, state_store):
+        await state_store.create_run("run-001", "test-project")
+
+        await state_store.create_tasks_bulk([
+            {"task_id": "task-a", "run_id": "run-001", "title": "Task A"},
+            {
+                "task_id": "task-b", "run_id": "run-001", "title": "Task B",
+                "dependencies": ["task-a"],
+            },
+            {"task_id": "task-c", "run_id": "run-001", "title": "Task C"},
+        ])
+
+        pending = await state_store.get_pending_tasks("run-001")
         pending_ids = {t["id"] for t in pending}
         assert "task-a" in pending_ids
         assert "task-c" in pending_ids
         assert "task-b" not in pending_ids  # blocked by task-a
 
-        await state.update_task_status("task-a", TaskStatus.COMPLETED)
-        pending = await state.get_pending_tasks("run-001")
+        await state_store.update_task_status("task-a", TaskStatus.COMPLETED)
+        pending = await state_store.get_pending_tasks("run-001")
         pending_ids = {t["id"] for t in pending}
         assert "task-b" in pending_ids  # now unblocked
 
-        await state.close()
+    @pytest.mark.asyncio
+    async def test_create_tasks_bulk(self, state_store):
+        await state_store.create_run("run-001", "test-project")
+
+        await state_store.create_tasks_bulk([
+            {"task_id": "t1", "run_id": "run-001", "title": "First", "priority": 2},
+            {"task_id": "t2", "run_id": "run-001", "title": "Second", "dependencies": ["t1"]},
+        ])
+
+        tasks = await state_store.list_tasks("run-001")
+        assert [t["id"] for t in tasks] == ["t1", "t2"]
+        assert tasks[1]["dependencies"] == '["t1"]'
+        assert StateStore.parse_dependencies(tasks[1]) == ["t1"]
+        tasks = await state_store.list_tasks("run-001", parse_json=True)
+        assert tasks[1]["dependencies"] == ["t1"]
+        assert all(t["status"] == "pending" for t in tasks)
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_concurrent_writes(self, state_store):
+        await state_store.create_run("run-001", "test-project")
+        await state_store.create_task("task-1", "run-001", "Task 1")
+
+        # The second row is a duplicate, so the bulk insert rolls back.
+        failing = state_store.create_tasks_bulk([
+            {"task_id": "task-2", "run_id": "run-001", "title": "Task 2"},
+            {"task_id": "task-1", "run_id": "run-001", "title": "Task 1"},
+        ])
+        other = state_store.update_task_status("task-1", TaskStatus.COMPLETED)
+        results = await asyncio.gather(failing, other, return_exceptions=True)
+
+        assert isinstance(results[0], sqlite3.IntegrityError)
+        (task,) = await state_store.list_tasks("run-001")
+        assert task["id"] == "task-1"
+        assert task["status"] == TaskStatus.COMPLETED.value
 
     @pytest.mark.asyncio
-    async def test_run_summary(self, tmp_path):
-        state = StateStore(tmp_path / "test.db")
+    async def test_list_tasks_cache_is_invalidated_by_writes(self, state_store):
+        await state_store.create_run("run-001", "test-project")
+        await state_store.create_task("task-1", "run-001", "Task 1")
+
+        first = await state_store.list_tasks("run-001")
+        assert await state_store.list_tasks("run-001") == first
+
+        await state_store.update_task_status("task-1", TaskStatus.COMPLETED)
+        (task,) = await state_store.list_tasks("run-001")
+        assert task["status"] == TaskStatus.COMPLETED.value
+
+    @pytest.mark.asyncio
+    async def test_list_task_states(self, state_store):
+        await state_store.create_run("run-001", "test-project")
+        await state_store.create_task("task-1", "run-001", "Task 1", description="long text")
+        await state_store.create_task(
+            "task-2", "run-001", "Task 2", priority=5, dependencies=["task-1"]
+        )
+
+        states = await state_store.list_task_states("run-001")
+
+        assert states == [
+            {"id": "task-2", "status": "pending", "priority": 5, "dependencies": ["task-1"]},
+            {"id": "task-1", "status": "pending", "priority": 0, "dependencies": []},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_timestamps_are_epoch_millis(self, state_store):
+        run = await state_store.create_run("run-001", "test-project")
+        fetched = await state_store.get_run("run-001")
+
+        assert isinstance(fetched["created_at"], int)
+        assert fetched["created_at"] == run["created_at"]
+        assert iso(0) == "1970-01-01T00:00:00+00:00"
+
+    @pytest.mark.asyncio
+    async def test_migrates_iso_timestamps(self, tmp_path):
+        db_path = tmp_path / "test.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(
+                "CREATE TABLE runs (id TEXT PRIMARY KEY, project_name TEXT NOT NULL, "
+                "status TEXT NOT NULL DEFAULT 'pending', created_at TEXT NOT NULL, "
+                "updated_at TEXT NOT NULL, config_snapshot TEXT);"
+                "INSERT INTO runs VALUES ('run-001', 'test-project', 'completed', "
+                "'2024-01-02T03:04:05.678000+00:00', '2024-01-02T03:04:05.678000+00:00', NULL);"
+            )
+        conn.close()
+
+        state = StateStore(db_path)
         await state.initialize()
+        try:
+            run = await state.get_run("run-001")
+
+            assert run["created_at"] == 1704164645678
+            assert iso(run["created_at"]) == "2024-01-02T03:04:05.678000+00:00"
+            await state.create_task("task-1", "run-001", "Task 1")
+            assert len(await state.list_tasks("run-001")) == 1
+        finally:
+            await state.close()
 
-        await state.create_run("run-001", "test-project")
-        await state.create_task("task-1", "run-001", "Task 1")
-        await state.create_task("task-2", "run-001", "Task 2")
-        await state.update_task_status("task-1", TaskStatus.COMPLETED)
+    @pytest.mark.asyncio
+    async def test_run_summary(self, state_store):
+        await state_store.create_run("run-001", "test-project")
+        await state_store.create_tasks_bulk([
+            {"task_id": "task-1", "run_id": "run-001", "title": "Task 1"},
+            {"task_id": "task-2", "run_id": "run-001", "title": "Task 2"},
+        ])
+        await state_store.update_task_status("task-1", TaskStatus.COMPLETED)
+
+        # The counts come from one GROUP BY over tasks, not from the task rows.
+        statements = []
+        await state_store.db.set_trace_callback(statements.append)
+        summary = await state_store.get_run_summary("run-001")
+        await state_store.db.set_trace_callback(None)
+        task_queries = [sql for sql in statements if "FROM tasks" in sql]
+        assert len(task_queries) == 1
+        assert "GROUP BY status" in task_queries[0]
 
-        summary = await state.get_run_summary("run-001")
         assert summary["total_tasks"] == 2
         assert summary["status_counts"]["completed"] == 1
         assert summary["status_counts"]["pending"] == 1
+        assert "tasks" not in summary
 
-        await state.close()
+        summary = await state_store.get_run_summary("run-001", include_tasks=True)
+        assert [t["id"] for t in summary["tasks"]] == ["task-1", "task-2"]
 
     @pytest.mark.asyncio
-    async def test_logging(self, tmp_path):
-        state = StateStore(tmp_path / "test.db")
-        await state.initialize()
-
-        await state.create_run("run-001", "test-project")
-        await state.create_task("task-1", "run-001", "Task 1")
+    async def test_logging(self, state_store):
+        await state_store.create_run("run-001", "test-project")
+        await state_store.create_task("task-1", "run-001", "Task 1")
 
-        await state.add_log("task-1", "Starting work", agent_name="developer")
-        await state.add_log("task-1", "Completed", level="info", metadata={"files": 3})
+        await state_store.add_log("task-1", "Starting work", agent_name="developer")
+        await state_store.add_log("task-1", "Completed", level="info", metadata={"files": 3})
 
-        logs = await state.get_logs("task-1")
+        with _direct_read(state_store) as db:
+            logs = db.execute(
+                "SELECT message, metadata FROM task_logs WHERE task_id = 'task-1' ORDER BY id"
+            ).fetchall()
         assert len(logs) == 2
         assert logs[0]["message"] == "Starting work"
-        assert logs[1]["metadata"]["files"] == 3
+        assert json.loads(logs[1]["metadata"])["files"] == 3
 
-        await state.close()
+    @pytest.mark.asyncio
+    async def test_add_logs_bulk(self, state_store):
+        await state_store.create_run("run-001", "test-project")
+        await state_store.create_task("task-1", "run-001", "Task 1")
 
+        await state_store.add_logs_bulk([
+            {"task_id": "task-1", "message": "Starting work", "agent_name": "developer"},
+            {"task_id": "task-1", "message": "Completed", "metadata": {"files": 3}},
+        ])
+
+        logs = await state_store.get_logs("task-1")
+        assert [log["message"] for log in logs] == ["Starting work", "Completed"]
+        assert logs[1]["metadata"] == {"files": 3}
 
-class TestTaskQueue:
     @pytest.mark.asyncio
-    async def test_parallel_execution(self, tmp_path):
-        state = StateStore(tmp_path / "test.db")
+    async def test_queued_logs_are_flushed(self, db_path):
+        state = StateStore(db_path)
         await state.initialize()
+        try:
+            await state.create_run("run-001", "test-project")
+            await state.create_task("task-1", "run-001", "Task 1")
 
-        await state.create_run("run-001", "test-project")
-        await state.create_task("task-1", "run-001", "Task 1", priority=5)
-        await state.create_task("task-2", "run-001", "Task 2", priority=3)
-        await state.create_task("task-3", "run-001", "Task 3", priority=1)
-
-        execution_order = []
-
-        async def mock_executor(task: dict) -> TaskResult:
-            execution_order.append(task["id"])
-            await asyncio.sleep(0.05)
-            return TaskResult(task_id=task["id"], success=True, output="ok")
+            state.queue_log("task-1", "Starting work", agent_name="developer")
+            state.queue_log("task-1", "Completed", metadata={"files": 3})
 
-        queue = TaskQueue(state=state, max_parallel=2)
-        results = await queue.execute_all("run-001", mock_executor)
+            logs = await state.get_logs("task-1")
+            assert [log["message"] for log in logs] == ["Starting work", "Completed"]
 
-        assert len(results) == 3
-        assert all(r.success for r in results)
+            state.queue_log("task-1", "Written on close")
+            await state.close()
 
-        for task_id in ["task-1", "task-2", "task-3"]:
-            task = await state.get_task(task_id)
-            assert task["status"] == "completed"
+            # Reopen the file to check the queued log reached disk.
+            await state.initialize()
+            assert len(await state.get_logs("task-1")) == 3
+        finally:
+            await state.close()
 
-        await state.close()
 
+class TestTaskQueue:
     @pytest.mark.asyncio
-    async def test_execution_with_dependencies(self, tmp_path):
-        state = StateStore(tmp_path / "test.db")
-        await state.initialize()
-
-        await state.create_run("run-001", "test-project")
-        await state.create_task("task-a", "run-001", "Task A")
-        await state.create_task("task-b", "run-001", "Task B", dependencies=["task-a"])
+    @pytest.mark.parametrize(
+        "tasks, failing, in_parallel",
+        [
+            pytest.param(
+                [
+                    {"task_id": "task-1", "title": "Task 1", "priority": 5},
+                    {"task_id": "task-2", "title": "Task 2", "priority": 3},
+                    {"task_id": "task-3", "title": "Task 3", "priority": 1},
+                ],
+                set(), 2, id="parallel",
+            ),
+            pytest.param(
+                [
+                    {"task_id": "task-a", "title": "Task A"},
+                    {"task_id": "task-b", "title": "Task B", "dependencies": ["task-a"]},
+                ],
+                set(), 1, id="dependencies",
+            ),
+            pytest.param(
+                [{"task_id": "task-1", "title": "Failing Task"}],
+                {"task-1"}, 1, id="failure",
+            ),
+        ],
+    )
+    async def test_execute_all(self, state_store, tasks, failing, in_parallel):
+        # ``failing`` tasks report an error; ``in_parallel`` tasks must be in
+        # flight together before any of them may finish.
+        await state_store.create_run("run-001", "test-project")
+        await state_store.create_tasks_bulk([{**t, "run_id": "run-001"} for t in tasks])
 
         execution_order = []
+        # Set only if the queue really runs that many at once (asyncio.Barrier is 3.11+).
+        enough_running = asyncio.Event()
+
+        running = max_running = 0
 
         async def mock_executor(task: dict) -> TaskResult:
+            nonlocal running, max_running
             execution_order.append(task["id"])
+            running += 1
+            max_running = max(max_running, running)
+            if len(execution_order) >= in_parallel:
+                enough_running.set()
+            await asyncio.wait_for(enough_running.wait(), timeout=5)
+            running -= 1
+            if task["id"] in failing:
+                return TaskResult(task_id=task["id"], success=False, error="Something went wrong")
             return TaskResult(task_id=task["id"], success=True, output="ok")
 
-        queue = TaskQueue(state=state, max_parallel=2)
+        queue = TaskQueue(state=state_store, max_parallel=2)
         results = await queue.execute_all("run-001", mock_executor)
 
-        assert len(results) == 2
-        assert execution_order.index("task-a") < execution_order.index("task-b")
+        assert len(results) == len(tasks)
+        assert in_parallel <= max_running <= queue.max_parallel
+        for result in results:
+            assert result.success == (result.task_id not in failing)
+            if not result.success:
+                assert result.error == "Something went wrong"
 
-        await state.close()
+        for t in tasks:
+            for dep in t.get("dependencies", ()):
+                assert execution_order.index(dep) < execution_order.index(t["task_id"])
+            task = await state_store.get_task(t["task_id"])
+            assert task["status"] == ("failed" if t["task_id"] in failing else "completed")
 
     @pytest.mark.asyncio
-    async def test_failed_task(self, tmp_path):
-        state = StateStore(tmp_path / "test.db")
-        await state.initialize()
+    async def test_dependents_of_failed_task_are_not_started(self, state_store):
+        await state_store.create_run("run-001", "test-project")
+        await state_store.create_task("task-a", "run-001", "Task A")
+        await state_store.create_task("task-b", "run-001", "Task B")
+        await state_store.create_task(
+            "task-c", "run-001", "Task C", dependencies=["task-a", "task-b"]
+        )
+        await state_store.create_task("task-d", "run-001", "Task D", dependencies=["task-c"])
+
+        executed = []
+
+        async def executor(task: dict) -> TaskResult:
+            executed.append(task["id"])
+            return TaskResult(task_id=task["id"], success=task["id"] != "task-c")
+
+        queue = TaskQueue(state=state_store, max_parallel=2)
+        await queue.execute_all("run-001", executor)
+
+        assert sorted(executed[:2]) == ["task-a", "task-b"]
+        assert executed[2:] == ["task-c"]
+        assert (await state_store.get_task("task-d"))["status"] == "pending"
+
+    @pytest.mark.asyncio
+    async def test_state_error_stops_every_worker(self, state_store, monkeypatch):
+        await state_store.create_run("run-001", "test-project")
+        await state_store.create_task("task-a", "run-001", "Task A")
+        await state_store.create_task("task-b", "run-001", "Task B", dependencies=["task-a"])
+        await state_store.create_task("task-c", "run-001", "Task C")
 
-        await state.create_run("run-001", "test-project")
-        await state.create_task("task-1", "run-001", "Failing Task")
+        update_tasks_status = state_store.update_tasks_status
+        calls = 0
 
-        async def failing_executor(task: dict) -> TaskResult:
-            return TaskResult(task_id=task["id"], success=False, error="Something went wrong")
+        async def failing_update(task_ids, status):
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                raise sqlite3.OperationalError("disk I/O error")
+            await update_tasks_status(task_ids, status)
 
-        queue = TaskQueue(state=state, max_parallel=2)
-        results = await queue.execute_all("run-001", failing_executor)
+        monkeypatch.setattr(state_store, "update_tasks_status", failing_update)
 
-        assert len(results) == 1
-        assert not results[0].success
-        assert results[0].error == "Something went wrong"
+        async def executor(task: dict) -> TaskResult:
+            return TaskResult(task_id=task["id"], success=True)
 
-        task = await state.get_task("task-1")
-        assert task["status"] == "failed"
+        queue = TaskQueue(state=state_store, max_parallel=2)
+        with pytest.raises(sqlite3.OperationalError):
+            await asyncio.wait_for(queue.execute_all("run-001", executor), 5)
 
-        await state.close()
+        running = [t.get_coro().__qualname__ for t in asyncio.all_tasks()]
+        assert "TaskQueue._worker" not in running